@@ -3,106 +3,289 @@ Profile Manager
 Handles saving and loading target profiles for building comprehensive OSINT files.
 """
 
+import copy
+import gzip
+import heapq
+import io
 import json
 import os
+import sys
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dumps_compact(data: Any) -> bytes:
+    """Serialize data to compact JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _intern_strings(data: Any) -> Any:
+    """Deduplicate repeated dict keys and short string values in parsed JSON
+
+    Profiles repeat the same keys ("status", "data", "scan_time", ...) across
+    every scan_history entry, and each parse allocates fresh string objects
+    for them. Collapsing duplicates to a single interned object cuts the
+    resident size of large profiles.
+    """
+    seen: Dict[str, str] = {}
+
+    def canonical(s: str) -> str:
+        cached = seen.get(s)
+        if cached is None:
+            cached = sys.intern(s)
+            seen[s] = cached
+        return cached
+
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in list(node.keys()):
+                value = node.pop(key)
+                if isinstance(value, str) and len(value) <= 32:
+                    value = canonical(value)
+                elif isinstance(value, (dict, list)):
+                    stack.append(value)
+                node[canonical(key)] = value
+        elif isinstance(node, list):
+            for i, item in enumerate(node):
+                if isinstance(item, str) and len(item) <= 32:
+                    node[i] = canonical(item)
+                elif isinstance(item, (dict, list)):
+                    stack.append(item)
+
+    return data
+
+
+# Maps a search type to its summary field and the key under data["summary"]
+_SUMMARY_MAP = {
+    "social": ("social_media_profiles", "found_profiles"),
+    "breach": ("breaches_found", "total_breaches"),
+    "public": ("public_records", "total_records"),
+    "domain": ("domains_checked", "domains_checked"),
+    "images": ("images_found", "images_found"),
+    "geolocation": ("locations_found", "total_locations")
+}
+
+_PROFILE_HTML_HEADER = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>OSINT Profile</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .section { margin: 20px 0; }
+        .summary { background-color: #e8f4f8; padding: 15px; border-radius: 5px; }
+    </style>
+</head>
+<body>
+"""
+
 
 class ProfileManager:
     """Manages target profiles and their associated data"""
     
-    def __init__(self, profiles_dir: str = "profiles"):
+    def __init__(self, profiles_dir: str = "profiles", compress: bool = False):
         """Initialize profile manager"""
         self.profiles_dir = Path(profiles_dir)
         self.profiles_dir.mkdir(exist_ok=True)
+        self.compress = compress
+        # Parsed profiles keyed by path, validated by (mtime_ns, size)
+        self._cache: Dict[str, tuple] = {}
+        self._index_file = self.profiles_dir / "_index.json"
     
-    def save_profile(self, target: Dict[str, str], scan_results: Dict[str, Any], 
+    def save_profile(self, target: Dict[str, str], scan_results: Dict[str, Any],
                     profile_name: Optional[str] = None) -> str:
         """Save a target profile with scan results"""
-        
+        profile_name, profile_data = self._prepare_profile(target, scan_results, profile_name)
+        profile_file = self._write_profile(profile_name, profile_data)
+        self._update_index(profile_name, profile_data, profile_file)
+
+        return profile_name
+
+    def save_profiles_batch(self, items: List[tuple]) -> List[str]:
+        """Save many profiles with one index rewrite and one directory sync
+
+        Each item is (target, scan_results) or (target, scan_results,
+        profile_name). Useful for bulk imports where per-profile index
+        rewrites and metadata syncs would dominate.
+        """
+        index = self._load_index()
+        if index is None:
+            index = self._rebuild_index()
+
+        saved = []
+        for item in items:
+            target, scan_results = item[0], item[1]
+            profile_name = item[2] if len(item) > 2 else None
+
+            profile_name, profile_data = self._prepare_profile(target, scan_results, profile_name)
+            profile_file = self._write_profile(profile_name, profile_data)
+            index[profile_name] = self._index_entry(profile_name, profile_data, profile_file)
+            saved.append(profile_name)
+
+        self._write_index(index)
+
+        # One directory sync covers all the renames above
+        try:
+            dir_fd = os.open(self.profiles_dir, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+        return saved
+
+    def _prepare_profile(self, target: Dict[str, str], scan_results: Dict[str, Any],
+                         profile_name: Optional[str] = None) -> tuple:
+        """Build the profile data to save, merging with any existing profile"""
         # Generate profile name if not provided
         if not profile_name:
             profile_name = self._generate_profile_name(target)
-        
+
         # Create profile data structure
+        now_iso = datetime.now().isoformat()
         profile_data = {
             "target": target,
             "profile_name": profile_name,
-            "created_at": datetime.now().isoformat(),
-            "last_updated": datetime.now().isoformat(),
+            "created_at": now_iso,
+            "last_updated": now_iso,
             "scan_history": [],
             "current_data": scan_results,
             "summary": self._generate_summary(scan_results)
         }
-        
+
         # Load existing profile if it exists
         existing_profile = self.load_profile(profile_name)
         if existing_profile:
             # Merge with existing data
             profile_data = self._merge_profiles(existing_profile, profile_data)
-        
-        # Save to file
-        profile_file = self.profiles_dir / f"{profile_name}.json"
-        with open(profile_file, 'w') as f:
-            json.dump(profile_data, f, indent=2)
-        
-        return profile_name
+
+        return profile_name, profile_data
+
+    def _write_profile(self, profile_name: str, profile_data: Dict[str, Any]) -> Path:
+        """Write a profile to disk: compact bytes, atomically via temp file"""
+        payload = _dumps_compact(profile_data)
+        if self.compress:
+            profile_file = self.profiles_dir / f"{profile_name}.json.gz"
+            payload = gzip.compress(payload, compresslevel=1)
+        else:
+            profile_file = self.profiles_dir / f"{profile_name}.json"
+
+        tmp_file = profile_file.with_name(profile_file.name + ".tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, profile_file)
+
+        self._cache.pop(str(profile_file), None)
+        return profile_file
     
+    def _profile_path(self, profile_name: str) -> Optional[Path]:
+        """Locate the on-disk file for a profile, plain or gzip-compressed"""
+        for suffix in (".json", ".json.gz"):
+            candidate = self.profiles_dir / f"{profile_name}{suffix}"
+            if candidate.exists():
+                return candidate
+        return None
+
     def load_profile(self, profile_name: str) -> Optional[Dict[str, Any]]:
         """Load a target profile"""
-        profile_file = self.profiles_dir / f"{profile_name}.json"
-        
-        if not profile_file.exists():
+        profile_file = self._profile_path(profile_name)
+        if profile_file is None:
             return None
-        
+
+        try:
+            stat = profile_file.stat()
+        except OSError:
+            return None
+
+        cache_key = str(profile_file)
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] == (stat.st_mtime_ns, stat.st_size):
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(profile_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            raw = profile_file.read_bytes()
+            if profile_file.name.endswith(".gz"):
+                raw = gzip.decompress(raw)
+            profile_data = _intern_strings(_loads(raw))
+        except (ValueError, IOError):
             return None
+
+        self._cache[cache_key] = ((stat.st_mtime_ns, stat.st_size), profile_data)
+        return copy.deepcopy(profile_data)
     
-    def list_profiles(self) -> List[Dict[str, Any]]:
-        """List all available profiles"""
-        profiles = []
-        
-        for profile_file in self.profiles_dir.glob("*.json"):
-            try:
-                with open(profile_file, 'r') as f:
-                    profile_data = json.load(f)
-                    profiles.append({
-                        "name": profile_data.get("profile_name", profile_file.stem),
-                        "target": profile_data.get("target", {}),
-                        "created_at": profile_data.get("created_at", ""),
-                        "last_updated": profile_data.get("last_updated", ""),
-                        "scan_count": len(profile_data.get("scan_history", [])),
-                        "file_path": str(profile_file)
-                    })
-            except (json.JSONDecodeError, IOError):
-                continue
-        
-        return sorted(profiles, key=lambda x: x["last_updated"], reverse=True)
+    def list_profiles(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List available profiles, most recently updated first"""
+        index = self._load_index()
+
+        if index is None:
+            index = self._rebuild_index()
+
+        if limit is not None:
+            return heapq.nlargest(limit, index.values(), key=lambda x: x["last_updated"])
+
+        return sorted(index.values(), key=lambda x: x["last_updated"], reverse=True)
     
     def delete_profile(self, profile_name: str) -> bool:
         """Delete a target profile"""
-        profile_file = self.profiles_dir / f"{profile_name}.json"
-        
-        if profile_file.exists():
+        profile_file = self._profile_path(profile_name)
+
+        if profile_file is not None:
             profile_file.unlink()
+            self._cache.pop(str(profile_file), None)
+            self._remove_from_index(profile_name)
             return True
-        
+
         return False
     
     def export_profile(self, profile_name: str, format_type: str = "json") -> Optional[str]:
         """Export a profile in various formats"""
+        if format_type == "json":
+            # The on-disk file already is the JSON representation
+            profile_file = self._profile_path(profile_name)
+            if profile_file is not None:
+                try:
+                    raw = profile_file.read_bytes()
+                    if profile_file.name.endswith(".gz"):
+                        raw = gzip.decompress(raw)
+                    return raw.decode("utf-8")
+                except (OSError, ValueError):
+                    pass
+
         profile_data = self.load_profile(profile_name)
-        
+
         if not profile_data:
             return None
-        
+
         if format_type == "json":
-            return json.dumps(profile_data, indent=2)
+            return _dumps(profile_data).decode("utf-8")
         elif format_type == "markdown":
             return self._export_to_markdown(profile_data)
         elif format_type == "html":
@@ -110,6 +293,94 @@ class ProfileManager:
         else:
             raise ValueError(f"Unsupported format: {format_type}")
     
+    def _load_index(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the profile index, or None if it is missing or stale"""
+        try:
+            index = _loads(self._index_file.read_bytes())
+        except (ValueError, OSError):
+            return None
+
+        if not isinstance(index, dict):
+            return None
+
+        # Stale if the set of profile files no longer matches the index
+        profile_files = set(self._iter_profile_files())
+        if profile_files != {entry.get("file_path") for entry in index.values()}:
+            return None
+
+        return index
+
+    def _iter_profile_files(self):
+        """Yield profile file paths using scandir, skipping the index file"""
+        index_name = self._index_file.name
+        try:
+            with os.scandir(self.profiles_dir) as entries:
+                for entry in entries:
+                    if (entry.name.endswith((".json", ".json.gz"))
+                            and entry.name != index_name and entry.is_file()):
+                        yield entry.path
+        except OSError:
+            return
+
+    def _rebuild_index(self) -> Dict[str, Dict[str, Any]]:
+        """Rebuild the profile index by parsing every profile file"""
+        index = {}
+
+        for path in self._iter_profile_files():
+            profile_file = Path(path)
+            try:
+                raw = profile_file.read_bytes()
+                if profile_file.name.endswith(".gz"):
+                    raw = gzip.decompress(raw)
+                profile_data = _loads(raw)
+            except (ValueError, IOError):
+                continue
+            stem = profile_file.name.rsplit(".json", 1)[0]
+            name = profile_data.get("profile_name", stem)
+            index[name] = self._index_entry(name, profile_data, profile_file)
+
+        self._write_index(index)
+        return index
+
+    def _update_index(self, profile_name: str, profile_data: Dict[str, Any],
+                      profile_file: Path) -> None:
+        """Upsert a single profile into the index"""
+        index = self._load_index()
+        if index is None:
+            self._rebuild_index()
+            return
+
+        index[profile_name] = self._index_entry(profile_name, profile_data, profile_file)
+        self._write_index(index)
+
+    def _remove_from_index(self, profile_name: str) -> None:
+        """Remove a profile from the index"""
+        index = self._load_index()
+        if index is not None and profile_name in index:
+            del index[profile_name]
+            self._write_index(index)
+
+    def _index_entry(self, profile_name: str, profile_data: Dict[str, Any],
+                     profile_file: Path) -> Dict[str, Any]:
+        """Build the index entry for a profile"""
+        return {
+            "name": profile_name,
+            "target": profile_data.get("target", {}),
+            "created_at": profile_data.get("created_at", ""),
+            "last_updated": profile_data.get("last_updated", ""),
+            "scan_count": len(profile_data.get("scan_history", [])),
+            "file_path": str(profile_file)
+        }
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Write the index atomically via a temp file and rename"""
+        tmp_file = self._index_file.with_suffix(".tmp")
+        try:
+            tmp_file.write_bytes(_dumps(index))
+            os.replace(tmp_file, self._index_file)
+        except OSError:
+            pass
+
     def _generate_profile_name(self, target: Dict[str, str]) -> str:
         """Generate a unique profile name from target data"""
         # Try to use username first
@@ -149,28 +420,23 @@ class ProfileManager:
         for search_type, scan_data in scan_results.get("results", {}).items():
             if isinstance(scan_data, dict) and scan_data.get("status") == "completed":
                 summary["total_scans"] += 1
-                
-                data = scan_data.get("data", {})
-                
-                if search_type == "social":
-                    summary["social_media_profiles"] = data.get("summary", {}).get("found_profiles", 0)
-                elif search_type == "breach":
-                    summary["breaches_found"] = data.get("summary", {}).get("total_breaches", 0)
-                elif search_type == "public":
-                    summary["public_records"] = data.get("summary", {}).get("total_records", 0)
-                elif search_type == "domain":
-                    summary["domains_checked"] = data.get("summary", {}).get("domains_checked", 0)
-                elif search_type == "images":
-                    summary["images_found"] = data.get("summary", {}).get("images_found", 0)
-                elif search_type == "geolocation":
-                    summary["locations_found"] = data.get("summary", {}).get("total_locations", 0)
-        
+
+                entry = _SUMMARY_MAP.get(search_type)
+                if entry:
+                    data_summary = scan_data.get("data", {}).get("summary", {})
+                    summary[entry[0]] = data_summary.get(entry[1], 0)
+
         return summary
     
     def _merge_profiles(self, existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge new scan results with existing profile data"""
-        merged = existing.copy()
-        
+        """Merge new scan results into the existing profile data in place
+
+        The caller owns `existing` (load_profile hands back a private deep
+        copy), so mutating it directly is safe and avoids re-allocating the
+        profile dict on every save.
+        """
+        merged = existing
+
         # Update timestamps
         merged["last_updated"] = new["last_updated"]
         
@@ -187,15 +453,43 @@ class ProfileManager:
             new["current_data"]
         )
         
-        # Update summary
-        merged["summary"] = self._generate_summary(merged["current_data"])
-        
+        # Update summary incrementally from the new scan only
+        merged["summary"] = self._apply_delta(
+            merged.get("summary", {}),
+            self._summary_delta(new["current_data"])
+        )
+
         return merged
     
+    def _summary_delta(self, scan_results: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute the summary fields affected by a single scan's results"""
+        delta = {"total_scans": 0}
+
+        for search_type, scan_data in scan_results.get("results", {}).items():
+            if isinstance(scan_data, dict) and scan_data.get("status") == "completed":
+                delta["total_scans"] += 1
+
+                entry = _SUMMARY_MAP.get(search_type)
+                if entry:
+                    data_summary = scan_data.get("data", {}).get("summary", {})
+                    delta[entry[0]] = data_summary.get(entry[1], 0)
+
+        return delta
+
+    def _apply_delta(self, summary: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply a summary delta: total_scans accumulates, other fields overwrite"""
+        for key, value in delta.items():
+            if key == "total_scans":
+                summary[key] = summary.get(key, 0) + value
+            else:
+                summary[key] = value
+
+        return summary
+
     def _merge_scan_results(self, existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge scan results, combining data from both"""
-        merged = existing.copy()
-        
+        """Merge scan results in place, combining data from both"""
+        merged = existing
+
         # Merge results by search type
         for search_type, new_data in new.get("results", {}).items():
             if search_type not in merged.get("results", {}):
@@ -209,9 +503,9 @@ class ProfileManager:
         return merged
     
     def _merge_search_data(self, existing: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
-        """Merge data from the same search type"""
-        merged = existing.copy()
-        
+        """Merge data from the same search type in place"""
+        merged = existing
+
         # Merge data field
         if "data" in new and "data" in existing:
             merged["data"] = self._merge_data_structures(existing["data"], new["data"])
@@ -227,18 +521,25 @@ class ProfileManager:
         return merged
     
     def _merge_data_structures(self, existing: Any, new: Any) -> Any:
-        """Recursively merge data structures"""
+        """Iteratively merge data structures, mutating nested containers in place"""
         if isinstance(existing, dict) and isinstance(new, dict):
-            merged = existing.copy()
-            for key, value in new.items():
-                if key in merged:
-                    merged[key] = self._merge_data_structures(merged[key], value)
-                else:
-                    merged[key] = value
-            return merged
+            stack = [(existing, new)]
+            while stack:
+                dst, src = stack.pop()
+                for key, value in src.items():
+                    if key in dst:
+                        current = dst[key]
+                        if isinstance(current, dict) and isinstance(value, dict):
+                            stack.append((current, value))
+                        elif isinstance(current, list) and isinstance(value, list):
+                            # For lists, just append new items
+                            current.extend(value)
+                        else:
+                            dst[key] = value
+                    else:
+                        dst[key] = value
+            return existing
         elif isinstance(existing, list) and isinstance(new, list):
-            # For lists, we might want to append or merge based on content
-            # For now, just append new items
             return existing + new
         else:
             # For other types, prefer new value
@@ -246,101 +547,88 @@ class ProfileManager:
     
     def _export_to_markdown(self, profile_data: Dict[str, Any]) -> str:
         """Export profile to markdown format"""
-        md_content = []
-        
+        buf = io.StringIO()
+        w = buf.write
+
         target = profile_data.get("target", {})
-        current_data = profile_data.get("current_data", {})
-        
-        md_content.append(f"# OSINT Profile: {profile_data.get('profile_name', 'Unknown')}")
-        md_content.append(f"**Created:** {profile_data.get('created_at', 'Unknown')}")
-        md_content.append(f"**Last Updated:** {profile_data.get('last_updated', 'Unknown')}")
-        md_content.append("")
-        
+
+        w(f"# OSINT Profile: {profile_data.get('profile_name', 'Unknown')}\n")
+        w(f"**Created:** {profile_data.get('created_at', 'Unknown')}\n")
+        w(f"**Last Updated:** {profile_data.get('last_updated', 'Unknown')}\n")
+        w("\n")
+
         # Target information
-        md_content.append("## Target Information")
+        w("## Target Information\n")
         for key, value in target.items():
             if value:
-                md_content.append(f"- **{key.title()}:** {value}")
-        md_content.append("")
-        
+                w(f"- **{key.title()}:** {value}\n")
+        w("\n")
+
         # Summary
         summary = profile_data.get("summary", {})
-        md_content.append("## Summary")
-        md_content.append(f"- **Total Scans:** {summary.get('total_scans', 0)}")
-        md_content.append(f"- **Social Media Profiles:** {summary.get('social_media_profiles', 0)}")
-        md_content.append(f"- **Data Breaches:** {summary.get('breaches_found', 0)}")
-        md_content.append(f"- **Public Records:** {summary.get('public_records', 0)}")
-        md_content.append(f"- **Domains Checked:** {summary.get('domains_checked', 0)}")
-        md_content.append(f"- **Images Found:** {summary.get('images_found', 0)}")
-        md_content.append(f"- **Locations Found:** {summary.get('locations_found', 0)}")
-        md_content.append("")
-        
+        w("## Summary\n")
+        w(f"- **Total Scans:** {summary.get('total_scans', 0)}\n")
+        w(f"- **Social Media Profiles:** {summary.get('social_media_profiles', 0)}\n")
+        w(f"- **Data Breaches:** {summary.get('breaches_found', 0)}\n")
+        w(f"- **Public Records:** {summary.get('public_records', 0)}\n")
+        w(f"- **Domains Checked:** {summary.get('domains_checked', 0)}\n")
+        w(f"- **Images Found:** {summary.get('images_found', 0)}\n")
+        w(f"- **Locations Found:** {summary.get('locations_found', 0)}\n")
+        w("\n")
+
         # Scan history
         scan_history = profile_data.get("scan_history", [])
         if scan_history:
-            md_content.append("## Scan History")
+            w("## Scan History\n")
             for i, scan in enumerate(scan_history, 1):
-                md_content.append(f"### Scan {i} - {scan.get('timestamp', 'Unknown')}")
-                md_content.append("")
-        
-        return "\n".join(md_content)
+                w(f"### Scan {i} - {scan.get('timestamp', 'Unknown')}\n")
+                w("\n")
+
+        return buf.getvalue()
     
     def _export_to_html(self, profile_data: Dict[str, Any]) -> str:
         """Export profile to HTML format"""
-        html_content = []
-        
+        buf = io.StringIO()
+        w = buf.write
+
         target = profile_data.get("target", {})
-        
-        html_content.append("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>OSINT Profile</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
-        .section { margin: 20px 0; }
-        .summary { background-color: #e8f4f8; padding: 15px; border-radius: 5px; }
-    </style>
-</head>
-<body>
-""")
-        
-        html_content.append(f"""
+
+        w(_PROFILE_HTML_HEADER)
+        w("\n")
+
+        w(f"""
     <div class="header">
         <h1>OSINT Profile: {profile_data.get('profile_name', 'Unknown')}</h1>
         <p><strong>Created:</strong> {profile_data.get('created_at', 'Unknown')}</p>
         <p><strong>Last Updated:</strong> {profile_data.get('last_updated', 'Unknown')}</p>
     </div>
 """)
-        
+
         # Target information
-        html_content.append('<div class="section">')
-        html_content.append('<h2>Target Information</h2>')
-        html_content.append('<ul>')
+        w('<div class="section">\n')
+        w('<h2>Target Information</h2>\n')
+        w('<ul>\n')
         for key, value in target.items():
             if value:
-                html_content.append(f'<li><strong>{key.title()}:</strong> {value}</li>')
-        html_content.append('</ul>')
-        html_content.append('</div>')
-        
+                w(f'<li><strong>{key.title()}:</strong> {value}</li>\n')
+        w('</ul>\n')
+        w('</div>\n')
+
         # Summary
         summary = profile_data.get("summary", {})
-        html_content.append('<div class="section summary">')
-        html_content.append('<h2>Summary</h2>')
-        html_content.append('<ul>')
-        html_content.append(f'<li><strong>Total Scans:</strong> {summary.get("total_scans", 0)}</li>')
-        html_content.append(f'<li><strong>Social Media Profiles:</strong> {summary.get("social_media_profiles", 0)}</li>')
-        html_content.append(f'<li><strong>Data Breaches:</strong> {summary.get("breaches_found", 0)}</li>')
-        html_content.append(f'<li><strong>Public Records:</strong> {summary.get("public_records", 0)}</li>')
-        html_content.append(f'<li><strong>Domains Checked:</strong> {summary.get("domains_checked", 0)}</li>')
-        html_content.append(f'<li><strong>Images Found:</strong> {summary.get("images_found", 0)}</li>')
-        html_content.append(f'<li><strong>Locations Found:</strong> {summary.get("locations_found", 0)}</li>')
-        html_content.append('</ul>')
-        html_content.append('</div>')
-        
-        html_content.append("</body></html>")
-        
-        return "\n".join(html_content) 
\ No newline at end of file
+        w('<div class="section summary">\n')
+        w('<h2>Summary</h2>\n')
+        w('<ul>\n')
+        w(f'<li><strong>Total Scans:</strong> {summary.get("total_scans", 0)}</li>\n')
+        w(f'<li><strong>Social Media Profiles:</strong> {summary.get("social_media_profiles", 0)}</li>\n')
+        w(f'<li><strong>Data Breaches:</strong> {summary.get("breaches_found", 0)}</li>\n')
+        w(f'<li><strong>Public Records:</strong> {summary.get("public_records", 0)}</li>\n')
+        w(f'<li><strong>Domains Checked:</strong> {summary.get("domains_checked", 0)}</li>\n')
+        w(f'<li><strong>Images Found:</strong> {summary.get("images_found", 0)}</li>\n')
+        w(f'<li><strong>Locations Found:</strong> {summary.get("locations_found", 0)}</li>\n')
+        w('</ul>\n')
+        w('</div>\n')
+
+        w("</body></html>")
+
+        return buf.getvalue() 
\ No newline at end of file
@@ -3,12 +3,209 @@ Report Generator
 Handles report generation in multiple formats (JSON, Markdown, HTML)
 """
 
+import html
+import io
 import json
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Any
 from utils.anonymizer import Anonymizer
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import jinja2
+except ImportError:
+    jinja2 = None
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data to indented JSON, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+_HTML_HEADER = """
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Auto OSINT Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .target { margin: 20px 0; border: 1px solid #ddd; border-radius: 5px; }
+        .target-header { background-color: #e0e0e0; padding: 10px; }
+        .scan-result { margin: 10px; padding: 10px; border-left: 3px solid #007acc; }
+        .success { border-left-color: #28a745; }
+        .error { border-left-color: #dc3545; }
+        .findings { margin-left: 20px; }
+        .finding { margin: 5px 0; padding: 5px; background-color: #f8f9fa; }
+    </style>
+</head>
+<body>
+"""
+
+_HTML_FOOTER = """
+</body>
+</html>
+"""
+
+_HTML_REPORT_HEADER_TPL = """
+    <div class="header">
+        <h1>Auto OSINT Report</h1>
+        <p><strong>Generated:</strong> {generated}</p>
+        <p><strong>Total Targets:</strong> {total_targets}</p>
+        <p><strong>Anonymized:</strong> {anonymize}</p>
+    </div>
+"""
+
+_HTML_TARGET_OPEN_TPL = """
+    <div class="target">
+        <div class="target-header">
+            <h2>Target {i}</h2>
+        </div>
+        <div style="padding: 10px;">
+            <h3>Target Information</h3>
+            <ul>
+"""
+
+_HTML_SCAN_OPEN_TPL = """
+            <div class="scan-result {status_class}">
+                <h4>{title} Search</h4>
+"""
+
+_HTML_SCAN_COMPLETED_TPL = """
+                <p><strong>Status:</strong> Completed</p>
+                <p><strong>Scan Time:</strong> {scan_time:.2f}s</p>
+"""
+
+_HTML_SCAN_FAILED_TPL = """
+                <p><strong>Status:</strong> Failed</p>
+                <p><strong>Error:</strong> {error}</p>
+"""
+
+# Compiled once at import; autoescape guards against markup in OSINT data
+_HTML_REPORT_JINJA_SRC = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Auto OSINT Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .target { margin: 20px 0; border: 1px solid #ddd; border-radius: 5px; }
+        .target-header { background-color: #e0e0e0; padding: 10px; }
+        .scan-result { margin: 10px; padding: 10px; border-left: 3px solid #007acc; }
+        .success { border-left-color: #28a745; }
+        .error { border-left-color: #dc3545; }
+        .findings { margin-left: 20px; }
+        .finding { margin: 5px 0; padding: 5px; background-color: #f8f9fa; }
+    </style>
+</head>
+<body>
+{%- macro render(node) -%}
+{%- if node is mapping -%}
+{%- for key, value in node.items() -%}
+{%- if value is mapping or (value is sequence and value is not string) %}
+                    <div class='finding'>
+                        <strong>{{ key }}:</strong>
+{{ render(value) }}
+                    </div>
+{%- else %}
+                    <div class='finding'>
+                        <strong>{{ key }}:</strong> {{ fmt(value) }}
+                    </div>
+{%- endif -%}
+{%- endfor -%}
+{%- elif node is sequence and node is not string -%}
+{%- for item in node -%}
+{%- if item is mapping -%}
+{{ render(item) }}
+{%- else %}
+                    <div class='finding'>
+                        - {{ fmt(item) }}
+                    </div>
+{%- endif -%}
+{%- endfor -%}
+{%- endif -%}
+{%- endmacro %}
+    <div class="header">
+        <h1>Auto OSINT Report</h1>
+        <p><strong>Generated:</strong> {{ generated }}</p>
+        <p><strong>Total Targets:</strong> {{ total_targets }}</p>
+        <p><strong>Anonymized:</strong> {{ anonymize }}</p>
+    </div>
+{% for result in results %}
+    <div class="target">
+        <div class="target-header">
+            <h2>Target {{ loop.index }}</h2>
+        </div>
+        <div style="padding: 10px;">
+            <h3>Target Information</h3>
+            <ul>
+{%- for key, value in result.get("target", {}).items() if value %}
+                <li><strong>{{ key.title() }}:</strong> {{ fmt(value) }}</li>
+{%- endfor %}
+            </ul>
+            <h3>Scan Results</h3>
+{%- for search_type, scan_data in result.get("results", {}).items() %}
+{%- set completed = scan_data is mapping and scan_data.get("status") == "completed" %}
+            <div class="scan-result {{ 'success' if completed else 'error' }}">
+                <h4>{{ search_type.title() }} Search</h4>
+{%- if completed %}
+                <p><strong>Status:</strong> Completed</p>
+                <p><strong>Scan Time:</strong> {{ "%.2f"|format(scan_data.get("scan_time", 0)) }}s</p>
+{%- if scan_data.get("data") %}
+                <div class='findings'>
+                    <p><strong>Findings:</strong></p>
+{{ render(scan_data["data"]) }}
+                </div>
+{%- else %}
+                <p><strong>Findings:</strong> No results found</p>
+{%- endif %}
+{%- else %}
+                <p><strong>Status:</strong> Failed</p>
+                <p><strong>Error:</strong> {{ scan_data.get("error", "Unknown error") if scan_data is mapping else scan_data }}</p>
+{%- endif %}
+            </div>
+{%- endfor %}
+        </div>
+    </div>
+{% endfor %}
+</body>
+</html>
+"""
+
+if jinja2 is not None:
+    _HTML_REPORT_JINJA = jinja2.Environment(
+        autoescape=True, auto_reload=False
+    ).from_string(_HTML_REPORT_JINJA_SRC)
+else:
+    _HTML_REPORT_JINJA = None
+
+def _html_fmt(fmt):
+    """Wrap a value formatter with HTML escaping for the fallback path
+
+    The jinja2 path autoescapes; the pure-Python renderer must escape
+    values itself so both emit the same markup-safe HTML.
+    """
+    return lambda v: html.escape(fmt(v))
+
+
+_MD_REPORT_HEADER_TPL = """# Auto OSINT Report
+**Generated:** {generated}
+**Total Targets:** {total_targets}
+**Anonymized:** {anonymize}
+
+"""
+
 
 class ReportGenerator:
     """Generate reports in various formats"""
@@ -28,9 +225,32 @@ class ReportGenerator:
             return self._generate_html_report(results, anonymize)
         else:
             raise ValueError(f"Unsupported format: {format_type}")
-    
-    def _generate_json_report(self, results: List[Dict[str, Any]], anonymize: bool) -> str:
-        """Generate JSON report"""
+
+    def iter_report(self, results: List[Dict[str, Any]], format_type: str = "markdown",
+                    anonymize: bool = False):
+        """Yield report chunks instead of one assembled string
+
+        Callers writing to disk can stream markdown/html with memory
+        bounded by one target's section rather than the whole document.
+        JSON is yielded as a single chunk.
+        """
+        if format_type == "json":
+            return iter((self._generate_json_report(results, anonymize),))
+        elif format_type == "markdown":
+            return self._iter_markdown_report(results, anonymize)
+        elif format_type == "html":
+            return self._iter_html_report(results, anonymize)
+        else:
+            raise ValueError(f"Unsupported format: {format_type}")
+
+    def build_report_data(self, results: List[Dict[str, Any]],
+                          anonymize: bool = False) -> Dict[str, Any]:
+        """Assemble the report structure without serializing it
+
+        Callers that serialize themselves (streaming writers, in-process
+        consumers) take this instead of re-parsing generate_report's
+        JSON string.
+        """
         report_data = {
             "report_metadata": {
                 "generated_at": datetime.now().isoformat(),
@@ -39,210 +259,282 @@ class ReportGenerator:
             },
             "results": results
         }
-        
+
         if anonymize:
             report_data = self.anonymizer.anonymize_data(report_data)
-        
-        return json.dumps(report_data, indent=2)
+
+        return report_data
+
+    def _generate_json_report(self, results: List[Dict[str, Any]], anonymize: bool) -> str:
+        """Generate JSON report"""
+        return _dumps(self.build_report_data(results, anonymize))
     
     def _generate_markdown_report(self, results: List[Dict[str, Any]], anonymize: bool) -> str:
         """Generate Markdown report"""
-        md_content = []
-        
+        return "".join(self._iter_markdown_report(results, anonymize))
+
+    def _iter_markdown_report(self, results: List[Dict[str, Any]], anonymize: bool):
+        """Yield the Markdown report one section at a time"""
+        # Bind the per-value formatter once instead of branching per leaf
+        fmt = (lambda v: self.anonymizer.anonymize_value(str(v))) if anonymize else str
+
         # Header
-        md_content.append("# Auto OSINT Report")
-        md_content.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        md_content.append(f"**Total Targets:** {len(results)}")
-        md_content.append(f"**Anonymized:** {anonymize}")
-        md_content.append("")
-        
-        # Process each target
+        yield _MD_REPORT_HEADER_TPL.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_targets=len(results),
+            anonymize=anonymize
+        )
+
+        # One chunk per target
         for i, result in enumerate(results, 1):
-            target = result.get("target", {})
-            scan_results = result.get("results", {})
-            
-            md_content.append(f"## Target {i}")
-            md_content.append("")
-            
-            # Target information
-            md_content.append("### Target Information")
-            for key, value in target.items():
-                if value:
-                    display_value = self.anonymizer.anonymize_value(value) if anonymize else value
-                    md_content.append(f"- **{key.title()}:** {display_value}")
-            md_content.append("")
-            
-            # Scan results
-            md_content.append("### Scan Results")
-            for search_type, scan_data in scan_results.items():
-                md_content.append(f"#### {search_type.title()} Search")
-                
-                if isinstance(scan_data, dict) and scan_data.get("status") == "completed":
-                    data = scan_data.get("data", {})
-                    scan_time = scan_data.get("scan_time", 0)
-                    
-                    md_content.append(f"- **Status:** Completed")
-                    md_content.append(f"- **Scan Time:** {scan_time:.2f}s")
-                    
-                    if data:
-                        md_content.append("- **Findings:**")
-                        self._add_findings_to_markdown(md_content, data, anonymize)
-                    else:
-                        md_content.append("- **Findings:** No results found")
+            yield self._markdown_target_section(i, result, fmt)
+
+    def _markdown_target_section(self, i: int, result: Dict[str, Any], fmt) -> str:
+        """Render one target's Markdown section"""
+        buf = io.StringIO()
+        w = buf.write
+
+        target = result.get("target", {})
+        scan_results = result.get("results", {})
+
+        w(f"## Target {i}\n")
+        w("\n")
+
+        # Target information
+        w("### Target Information\n")
+        for key, value in target.items():
+            if value:
+                w(f"- **{key.title()}:** {fmt(value)}\n")
+        w("\n")
+
+        # Scan results
+        w("### Scan Results\n")
+        for search_type, scan_data in scan_results.items():
+            w(f"#### {search_type.title()} Search\n")
+
+            if isinstance(scan_data, dict) and scan_data.get("status") == "completed":
+                data = scan_data.get("data", {})
+                scan_time = scan_data.get("scan_time", 0)
+
+                w("- **Status:** Completed\n")
+                w(f"- **Scan Time:** {scan_time:.2f}s\n")
+
+                if data:
+                    w("- **Findings:**\n")
+                    findings = []
+                    self._add_findings_to_markdown(findings, data, fmt)
+                    if findings:
+                        w("\n".join(findings))
+                        w("\n")
                 else:
-                    error = scan_data.get("error", "Unknown error") if isinstance(scan_data, dict) else str(scan_data)
-                    md_content.append(f"- **Status:** Failed")
-                    md_content.append(f"- **Error:** {error}")
-                
-                md_content.append("")
-        
-        return "\n".join(md_content)
-    
+                    w("- **Findings:** No results found\n")
+            else:
+                error = scan_data.get("error", "Unknown error") if isinstance(scan_data, dict) else str(scan_data)
+                w("- **Status:** Failed\n")
+                w(f"- **Error:** {error}\n")
+
+            w("\n")
+
+        return buf.getvalue()
+
+
     def _generate_html_report(self, results: List[Dict[str, Any]], anonymize: bool) -> str:
         """Generate HTML report"""
-        html_content = []
-        
+        if _HTML_REPORT_JINJA is not None:
+            fmt = (lambda v: self.anonymizer.anonymize_value(str(v))) if anonymize else str
+            return _HTML_REPORT_JINJA.render(
+                results=results,
+                generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                total_targets=len(results),
+                anonymize=anonymize,
+                fmt=fmt
+            )
+
+        return self._generate_html_report_py(results, anonymize)
+
+    def _iter_html_report(self, results: List[Dict[str, Any]], anonymize: bool):
+        """Yield the HTML report one section at a time"""
+        fmt = (lambda v: self.anonymizer.anonymize_value(str(v))) if anonymize else str
+
+        if _HTML_REPORT_JINJA is not None:
+            # jinja2 templates can stream natively
+            yield from _HTML_REPORT_JINJA.generate(
+                results=results,
+                generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                total_targets=len(results),
+                anonymize=anonymize,
+                fmt=fmt
+            )
+            return
+
+        fmt = _html_fmt(fmt)
+        yield _HTML_HEADER + "\n" + _HTML_REPORT_HEADER_TPL.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_targets=len(results),
+            anonymize=anonymize
+        )
+
+        for i, result in enumerate(results, 1):
+            yield self._html_target_section(i, result, fmt)
+
+        yield _HTML_FOOTER
+
+    def _generate_html_report_py(self, results: List[Dict[str, Any]], anonymize: bool) -> str:
+        """Pure-Python HTML report fallback when jinja2 is unavailable"""
+        # Bind the per-value formatter once instead of branching per leaf
+        fmt = _html_fmt(
+            (lambda v: self.anonymizer.anonymize_value(str(v))) if anonymize else str
+        )
+
+        buf = io.StringIO()
+        w = buf.write
+
         # HTML header
-        html_content.append("""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Auto OSINT Report</title>
-    <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
-        .target { margin: 20px 0; border: 1px solid #ddd; border-radius: 5px; }
-        .target-header { background-color: #e0e0e0; padding: 10px; }
-        .scan-result { margin: 10px; padding: 10px; border-left: 3px solid #007acc; }
-        .success { border-left-color: #28a745; }
-        .error { border-left-color: #dc3545; }
-        .findings { margin-left: 20px; }
-        .finding { margin: 5px 0; padding: 5px; background-color: #f8f9fa; }
-    </style>
-</head>
-<body>
-""")
-        
+        w(_HTML_HEADER)
+        w("\n")
+
         # Report header
-        html_content.append(f"""
-    <div class="header">
-        <h1>Auto OSINT Report</h1>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p><strong>Total Targets:</strong> {len(results)}</p>
-        <p><strong>Anonymized:</strong> {anonymize}</p>
-    </div>
-""")
-        
+        w(_HTML_REPORT_HEADER_TPL.format(
+            generated=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            total_targets=len(results),
+            anonymize=anonymize
+        ))
+
         # Process each target
         for i, result in enumerate(results, 1):
-            target = result.get("target", {})
-            scan_results = result.get("results", {})
-            
-            html_content.append(f"""
-    <div class="target">
-        <div class="target-header">
-            <h2>Target {i}</h2>
-        </div>
-        <div style="padding: 10px;">
-            <h3>Target Information</h3>
-            <ul>
-""")
-            
-            # Target information
-            for key, value in target.items():
-                if value:
-                    display_value = self.anonymizer.anonymize_value(value) if anonymize else value
-                    html_content.append(f"                <li><strong>{key.title()}:</strong> {display_value}</li>")
-            
-            html_content.append("            </ul>")
-            
-            # Scan results
-            html_content.append("            <h3>Scan Results</h3>")
-            
-            for search_type, scan_data in scan_results.items():
-                status_class = "success" if isinstance(scan_data, dict) and scan_data.get("status") == "completed" else "error"
-                
-                html_content.append(f"""
-            <div class="scan-result {status_class}">
-                <h4>{search_type.title()} Search</h4>
-""")
-                
-                if isinstance(scan_data, dict) and scan_data.get("status") == "completed":
-                    data = scan_data.get("data", {})
-                    scan_time = scan_data.get("scan_time", 0)
-                    
-                    html_content.append(f"""
-                <p><strong>Status:</strong> Completed</p>
-                <p><strong>Scan Time:</strong> {scan_time:.2f}s</p>
-""")
-                    
-                    if data:
-                        html_content.append("                <div class='findings'>")
-                        html_content.append("                    <p><strong>Findings:</strong></p>")
-                        self._add_findings_to_html(html_content, data, anonymize)
-                        html_content.append("                </div>")
-                    else:
-                        html_content.append("                <p><strong>Findings:</strong> No results found</p>")
-                else:
-                    error = scan_data.get("error", "Unknown error") if isinstance(scan_data, dict) else str(scan_data)
-                    html_content.append(f"""
-                <p><strong>Status:</strong> Failed</p>
-                <p><strong>Error:</strong> {error}</p>
-""")
-                
-                html_content.append("            </div>")
-            
-            html_content.append("        </div>")
-            html_content.append("    </div>")
-        
+            w(self._html_target_section(i, result, fmt))
+
         # HTML footer
-        html_content.append("""
-</body>
-</html>
-""")
-        
-        return "\n".join(html_content)
-    
-    def _add_findings_to_markdown(self, md_content: List[str], data: Dict[str, Any], anonymize: bool):
-        """Add findings to markdown content"""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    md_content.append(f"  - **{key}:**")
-                    self._add_findings_to_markdown(md_content, value, anonymize)
-                else:
-                    display_value = self.anonymizer.anonymize_value(str(value)) if anonymize else str(value)
-                    md_content.append(f"  - **{key}:** {display_value}")
-        elif isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    self._add_findings_to_markdown(md_content, item, anonymize)
-                else:
-                    display_value = self.anonymizer.anonymize_value(str(item)) if anonymize else str(item)
-                    md_content.append(f"  - {display_value}")
-    
-    def _add_findings_to_html(self, html_content: List[str], data: Dict[str, Any], anonymize: bool):
-        """Add findings to HTML content"""
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    html_content.append(f"                    <div class='finding'>")
-                    html_content.append(f"                        <strong>{key}:</strong>")
-                    self._add_findings_to_html(html_content, value, anonymize)
-                    html_content.append("                    </div>")
-                else:
-                    display_value = self.anonymizer.anonymize_value(str(value)) if anonymize else str(value)
-                    html_content.append(f"                    <div class='finding'>")
-                    html_content.append(f"                        <strong>{key}:</strong> {display_value}")
-                    html_content.append("                    </div>")
-        elif isinstance(data, list):
-            for item in data:
-                if isinstance(item, dict):
-                    self._add_findings_to_html(html_content, item, anonymize)
+        w(_HTML_FOOTER)
+
+        return buf.getvalue()
+
+    def _html_target_section(self, i: int, result: Dict[str, Any], fmt) -> str:
+        """Render one target's HTML section (pure-Python path)"""
+        buf = io.StringIO()
+        w = buf.write
+
+        target = result.get("target", {})
+        scan_results = result.get("results", {})
+
+        w(_HTML_TARGET_OPEN_TPL.format(i=i))
+
+        # Target information
+        for key, value in target.items():
+            if value:
+                w(f"                <li><strong>{html.escape(key.title())}:</strong> {fmt(value)}</li>\n")
+
+        w("            </ul>\n")
+
+        # Scan results
+        w("            <h3>Scan Results</h3>\n")
+
+        for search_type, scan_data in scan_results.items():
+            status_class = "success" if isinstance(scan_data, dict) and scan_data.get("status") == "completed" else "error"
+
+            w(_HTML_SCAN_OPEN_TPL.format(status_class=status_class,
+                                         title=html.escape(search_type.title())))
+
+            if isinstance(scan_data, dict) and scan_data.get("status") == "completed":
+                data = scan_data.get("data", {})
+                scan_time = scan_data.get("scan_time", 0)
+
+                w(_HTML_SCAN_COMPLETED_TPL.format(scan_time=scan_time))
+
+                if data:
+                    w("                <div class='findings'>\n")
+                    w("                    <p><strong>Findings:</strong></p>\n")
+                    findings = []
+                    self._add_findings_to_html(findings, data, fmt)
+                    if findings:
+                        w("\n".join(findings))
+                        w("\n")
+                    w("                </div>\n")
                 else:
-                    display_value = self.anonymizer.anonymize_value(str(item)) if anonymize else str(item)
-                    html_content.append(f"                    <div class='finding'>")
-                    html_content.append(f"                        - {display_value}")
-                    html_content.append("                    </div>") 
\ No newline at end of file
+                    w("                <p><strong>Findings:</strong> No results found</p>\n")
+            else:
+                error = scan_data.get("error", "Unknown error") if isinstance(scan_data, dict) else str(scan_data)
+                w(_HTML_SCAN_FAILED_TPL.format(error=html.escape(str(error))))
+
+            w("            </div>\n")
+
+        w("        </div>\n")
+        w("    </div>\n")
+
+        return buf.getvalue()
+
+
+    def _add_findings_to_markdown(self, md_content: List[str], data: Dict[str, Any], fmt):
+        """Add findings to markdown content using an explicit stack
+
+        `fmt` is the per-value formatter bound once by the caller: str when
+        anonymization is off, the anonymizer otherwise.
+        """
+        out_append = md_content.append
+
+        # Fast path: most scan data is a flat dict of scalar values
+        if isinstance(data, dict) and not any(isinstance(v, (dict, list)) for v in data.values()):
+            md_content.extend(f"  - **{k}:** {fmt(v)}" for k, v in data.items())
+            return
+
+        stack = [("node", data)]
+        while stack:
+            kind, node = stack.pop()
+            if kind == "line":
+                out_append(node)
+            elif isinstance(node, dict):
+                # Push in reverse so items emit in original order
+                for key, value in reversed(list(node.items())):
+                    if isinstance(value, (dict, list)):
+                        stack.append(("node", value))
+                        stack.append(("line", f"  - **{key}:**"))
+                    else:
+                        stack.append(("line", f"  - **{key}:** {fmt(value)}"))
+            elif isinstance(node, list):
+                for item in reversed(node):
+                    if isinstance(item, dict):
+                        stack.append(("node", item))
+                    else:
+                        stack.append(("line", f"  - {fmt(item)}"))
+
+    def _add_findings_to_html(self, html_content: List[str], data: Dict[str, Any], fmt):
+        """Add findings to HTML content using an explicit stack
+
+        `fmt` is the per-value formatter bound once by the caller: str when
+        anonymization is off, the anonymizer otherwise.
+        """
+        out_append = html_content.append
+
+        # Fast path: most scan data is a flat dict of scalar values
+        if isinstance(data, dict) and not any(isinstance(v, (dict, list)) for v in data.values()):
+            for k, v in data.items():
+                out_append("                    <div class='finding'>")
+                out_append(f"                        <strong>{html.escape(str(k))}:</strong> {fmt(v)}")
+                out_append("                    </div>")
+            return
+
+        stack = [("node", data)]
+        while stack:
+            kind, node = stack.pop()
+            if kind == "line":
+                out_append(node)
+            elif isinstance(node, dict):
+                # Push in reverse so items emit in original order
+                for key, value in reversed(list(node.items())):
+                    if isinstance(value, (dict, list)):
+                        stack.append(("line", "                    </div>"))
+                        stack.append(("node", value))
+                        stack.append(("line", f"                        <strong>{html.escape(str(key))}:</strong>"))
+                        stack.append(("line", "                    <div class='finding'>"))
+                    else:
+                        stack.append(("line", "                    </div>"))
+                        stack.append(("line", f"                        <strong>{html.escape(str(key))}:</strong> {fmt(value)}"))
+                        stack.append(("line", "                    <div class='finding'>"))
+            elif isinstance(node, list):
+                for item in reversed(node):
+                    if isinstance(item, dict):
+                        stack.append(("node", item))
+                    else:
+                        stack.append(("line", "                    </div>"))
+                        stack.append(("line", f"                        - {fmt(item)}"))
+                        stack.append(("line", "                    <div class='finding'>")) 
\ No newline at end of file
@@ -3,8 +3,12 @@ Main OSINT Scanner Engine
 Coordinates all search modules and manages the scanning process.
 """
 
+import asyncio
+import sys
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from modules.social_media import SocialMediaScanner
@@ -13,7 +17,49 @@ from modules.public_records import PublicRecordsScanner
 from modules.image_search import ImageScanner
 from modules.geolocation import GeolocationScanner
 from modules.domain_intelligence import DomainScanner
+from utils.http_client import get_default_client
 from utils.logger import setup_logger
+from utils.target_view import TargetView
+
+# uvloop is a drop-in libuv event loop that cuts per-task overhead for
+# callers driving scan_target_async; purely optional, and unsupported
+# on Windows
+if sys.platform != "win32":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        uvloop = None
+
+
+@dataclass(slots=True)
+class ScanResult:
+    """Result of a single scanner run
+
+    Slots keep the per-scan allocation small on the hot path; to_dict()
+    converts to the plain dict shape used by reports and saved profiles.
+    Per-entry payloads inside `data` stay plain dicts on purpose: they
+    cross the json/orjson boundary and are walked by the anonymizer,
+    both of which expect mappings.
+    """
+    data: Dict[str, Any]
+    scan_time: float = 0.0
+    status: str = "completed"
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the result entry dict used at the JSON boundary"""
+        if self.error is not None:
+            return {
+                "data": self.data,
+                "error": self.error,
+                "status": self.status
+            }
+        return {
+            "data": self.data,
+            "scan_time": self.scan_time,
+            "status": self.status
+        }
 
 
 class OSINTScanner:
@@ -33,14 +79,25 @@ class OSINTScanner:
         # Setup logging
         self.logger = setup_logger(debug=debug, verbose=verbose)
         
+        # One pooled HTTP client shared by every scanner: requests from
+        # different modules to the same provider reuse one keep-alive
+        # connection instead of each module re-handshaking
+        self.http_client = get_default_client(timeout=timeout)
+
         # Initialize scanners
         self.scanners = {
-            "social": SocialMediaScanner(config, timeout, headless, test_mode),
-            "breach": BreachScanner(config, timeout, test_mode),
-            "public": PublicRecordsScanner(config, timeout, test_mode),
-            "images": ImageScanner(config, timeout, headless, test_mode),
-            "geolocation": GeolocationScanner(config, timeout, test_mode),
-            "domain": DomainScanner(config, timeout, test_mode)
+            "social": SocialMediaScanner(config, timeout, headless, test_mode,
+                                         http_client=self.http_client),
+            "breach": BreachScanner(config, timeout, test_mode,
+                                    http_client=self.http_client),
+            "public": PublicRecordsScanner(config, timeout, test_mode,
+                                           http_client=self.http_client),
+            "images": ImageScanner(config, timeout, headless, test_mode,
+                                   http_client=self.http_client),
+            "geolocation": GeolocationScanner(config, timeout, test_mode,
+                                              http_client=self.http_client),
+            "domain": DomainScanner(config, timeout, test_mode,
+                                    http_client=self.http_client)
         }
         
         self.logger.info("OSINT Scanner initialized")
@@ -56,36 +113,90 @@ class OSINTScanner:
         }
         
         self.logger.info(f"Starting scan for target: {target}")
-        
+
+        requested = []
         for search_type in search_types:
             if search_type in self.scanners:
-                try:
-                    self.logger.info(f"Running {search_type} scan...")
-                    start_time = time.time()
-                    
-                    scanner = self.scanners[search_type]
-                    scan_results = scanner.scan(target, nsfw=nsfw)
-                    
-                    scan_time = time.time() - start_time
-                    results["results"][search_type] = {
-                        "data": scan_results,
-                        "scan_time": scan_time,
-                        "status": "completed"
-                    }
-                    
-                    self.logger.info(f"{search_type} scan completed in {scan_time:.2f}s")
-                    
-                except Exception as e:
-                    self.logger.error(f"Error in {search_type} scan: {e}")
-                    results["results"][search_type] = {
-                        "data": {},
-                        "error": str(e),
-                        "status": "failed"
-                    }
+                requested.append(search_type)
             else:
                 self.logger.warning(f"Unknown search type: {search_type}")
-        
+
+        if not requested:
+            return results
+
+        # Normalize the target once; every scanner reads the same view
+        # instead of re-walking (and re-splitting) the raw dict
+        view = TargetView.from_dict(target)
+
+        # Scanners are I/O-bound and independent, so run them concurrently;
+        # results are assigned in requested order so report sections and
+        # merged profiles stay deterministic across runs
+        with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+            futures = [
+                executor.submit(self._run_one, search_type, view, nsfw)
+                for search_type in requested
+            ]
+            for search_type, future in zip(requested, futures):
+                results["results"][search_type] = future.result().to_dict()
+
         return results
+
+    async def scan_target_async(self, target: Dict[str, str], search_types: List[str],
+                                nsfw: bool = False) -> Dict[str, Any]:
+        """Async variant of scan_target for callers already inside an event loop
+
+        The scanner modules are built on blocking requests sessions, so each
+        one runs in a worker thread; the event loop stays free while the
+        scans fan out concurrently.
+        """
+        results = {
+            "target": target,
+            "scan_time": datetime.now().isoformat(),
+            "search_types": search_types,
+            "results": {}
+        }
+
+        self.logger.info(f"Starting scan for target: {target}")
+
+        requested = []
+        for search_type in search_types:
+            if search_type in self.scanners:
+                requested.append(search_type)
+            else:
+                self.logger.warning(f"Unknown search type: {search_type}")
+
+        if not requested:
+            return results
+
+        view = TargetView.from_dict(target)
+
+        scans = [
+            asyncio.to_thread(self._run_one, search_type, view, nsfw)
+            for search_type in requested
+        ]
+        for search_type, entry in zip(requested, await asyncio.gather(*scans)):
+            results["results"][search_type] = entry.to_dict()
+
+        return results
+
+    def _run_one(self, search_type: str, target: TargetView,
+                 nsfw: bool) -> ScanResult:
+        """Run a single scanner, returning its timed result"""
+        try:
+            self.logger.info(f"Running {search_type} scan...")
+            start_time = time.time()
+
+            scanner = self.scanners[search_type]
+            scan_results = scanner.scan(target, nsfw=nsfw)
+
+            scan_time = time.time() - start_time
+            self.logger.info(f"{search_type} scan completed in {scan_time:.2f}s")
+
+            return ScanResult(data=scan_results, scan_time=scan_time)
+
+        except Exception as e:
+            self.logger.error(f"Error in {search_type} scan: {e}")
+            return ScanResult(data={}, status="failed", error=str(e))
     
     def get_timestamp(self) -> str:
         """Get current timestamp"""
@@ -7,13 +7,39 @@ A comprehensive OSINT tool for gathering intelligence from various sources.
 import argparse
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from core.scanner import OSINTScanner
 from core.reporter import ReportGenerator
 from core.profile_manager import ProfileManager
 from utils.config import load_config
 
 
+# Search flags in the order scans run; each name doubles as the argparse
+# attribute carrying its CLI flag
+SEARCH_FLAGS = ("social", "breach", "public", "images", "geolocation")
+
+# One scanner per (config, options) combination for the life of the
+# process: in-process callers reuse connection pools, warmed DNS and
+# scan caches across invocations instead of rebuilding them each run
+_SCANNER_CACHE = {}
+
+
+def get_scanner(config, **kwargs):
+    """Return a cached OSINTScanner for this config/options combination"""
+    key = (tuple(sorted((k, str(v)) for k, v in config.items())),
+           tuple(sorted(kwargs.items())))
+    scanner = _SCANNER_CACHE.get(key)
+    if scanner is None:
+        scanner = _SCANNER_CACHE[key] = OSINTScanner(config=config, **kwargs)
+    return scanner
+
+
 def get_help_text():
     """Read help text from README_HELP.md"""
     try:
@@ -73,6 +99,7 @@ def create_parser():
     other_group.add_argument("--headless", action="store_true", help="Run in headless mode")
     other_group.add_argument("--debug", action="store_true", help="Enable debug mode")
     other_group.add_argument("--test", action="store_true", help="Sandbox test mode")
+    other_group.add_argument("--no-cache", action="store_true", help="Bypass cached scan results")
     other_group.add_argument("--timeout", type=int, default=30, help="Request timeout in seconds")
     other_group.add_argument("--help", action="store_true", help="Show this help message")
     
@@ -90,11 +117,27 @@ def validate_inputs(args):
         sys.exit(1)
 
 
+def write_json_report(report, f):
+    """Write a JSON report to an open text file
+
+    orjson serializes in one fast pass when available; otherwise the
+    stdlib encoder streams chunks so the full serialized string is never
+    held in memory alongside the report dict.
+    """
+    if orjson is not None:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2).decode("utf-8"))
+    else:
+        for chunk in json.JSONEncoder(indent=2).iterencode(report):
+            f.write(chunk)
+
+
 def load_targets_from_file(file_path):
     """Load targets from input file"""
     try:
-        with open(file_path, 'r') as f:
-            return [line.strip() for line in f if line.strip()]
+        # Big read buffer plus a single strip per line; the old
+        # comprehension stripped every line twice
+        with open(file_path, 'r', buffering=1 << 20) as f:
+            return [s for s in (line.strip() for line in f) if s]
     except FileNotFoundError:
         print(f"Error: Input file '{file_path}' not found.")
         sys.exit(1)
@@ -103,6 +146,15 @@ def load_targets_from_file(file_path):
         sys.exit(1)
 
 
+def parse_target_line(line):
+    """Map an input-file line to a target dict"""
+    if "@" in line:
+        return {"email": line}
+    if "." in line:
+        return {"domain": line}
+    return {"username": line}
+
+
 def handle_profile_operations(args, profile_manager):
     """Handle profile-related operations"""
     
@@ -150,10 +202,23 @@ def handle_profile_operations(args, profile_manager):
         return
 
 
-def main():
+def run(argv=None):
+    """Programmatic entry point returning a process-style exit code
+
+    Lets callers (notably the test suite) drive the CLI in-process
+    instead of paying interpreter startup per invocation.
+    """
+    try:
+        main(argv)
+    except SystemExit as exc:
+        return exc.code if isinstance(exc.code, int) else 1
+    return 0
+
+
+def main(argv=None):
     """Main application entry point"""
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Handle help display
     if args.help:
@@ -165,6 +230,8 @@ def main():
     
     # Load configuration
     config = load_config()
+    if args.no_cache:
+        config["no_cache"] = True
     
     # Initialize profile manager
     profile_manager = ProfileManager()
@@ -176,27 +243,17 @@ def main():
     
     # Determine search types
     if args.full:
-        search_types = ["social", "breach", "public", "images", "geolocation"]
+        search_types = list(SEARCH_FLAGS)
     else:
-        search_types = []
-        if args.social:
-            search_types.append("social")
-        if args.breach:
-            search_types.append("breach")
-        if args.public:
-            search_types.append("public")
-        if args.images:
-            search_types.append("images")
-        if args.geolocation:
-            search_types.append("geolocation")
+        search_types = [name for name in SEARCH_FLAGS if getattr(args, name)]
     
     if not search_types:
         print("Warning: No search types specified. Use --full or specify individual search types.")
         return
     
-    # Initialize scanner
-    scanner = OSINTScanner(
-        config=config,
+    # Initialize scanner (reused across in-process invocations)
+    scanner = get_scanner(
+        config,
         verbose=args.verbose,
         debug=args.debug,
         timeout=args.timeout,
@@ -205,26 +262,26 @@ def main():
     )
     
     # Handle profile loading
-    target = None
     if args.load_profile:
         profile_data = profile_manager.load_profile(args.load_profile)
         if not profile_data:
             print(f"Profile '{args.load_profile}' not found.")
             sys.exit(1)
-        
-        target = profile_data["target"]
+
+        targets = [profile_data["target"]]
         print(f"Loaded profile: {args.load_profile}")
-        print(f"Target: {target}")
-        
+        print(f"Target: {targets[0]}")
+
         if args.verbose:
             summary = profile_data.get("summary", {})
             print(f"Previous scans: {summary.get('total_scans', 0)}")
     else:
         # Prepare targets
         targets = []
-        
+
         if args.input_file:
-            targets.extend(load_targets_from_file(args.input_file))
+            targets.extend(parse_target_line(line)
+                           for line in load_targets_from_file(args.input_file))
         else:
             target = {
                 "email": args.email,
@@ -237,47 +294,65 @@ def main():
             target = {k: v for k, v in target.items() if v is not None}
             if target:
                 targets.append(target)
-        
+
         if not targets:
             print("Error: No valid targets found.")
             sys.exit(1)
-        
-        # For now, handle single target
-        target = targets[0]
-    
-    # Process target
+
+    # Process targets; multiple targets are independent network-bound
+    # scans, so fan them out across threads
     try:
-        scan_results = scanner.scan_target(target, search_types, nsfw=args.nsfw)
-        
+        if len(targets) == 1:
+            scan_results_list = [scanner.scan_target(targets[0], search_types, nsfw=args.nsfw)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(targets))) as executor:
+                scan_results_list = list(executor.map(
+                    lambda t: scanner.scan_target(t, search_types, nsfw=args.nsfw),
+                    targets
+                ))
+
         # Save to profile if requested
         if args.save_profile or args.update_profile:
-            profile_name = args.profile_name or args.load_profile
-            saved_name = profile_manager.save_profile(target, scan_results, profile_name)
-            print(f"Profile saved: {saved_name}")
-        
+            for target, scan_results in zip(targets, scan_results_list):
+                # A custom name only makes sense for a single target
+                profile_name = (args.profile_name or args.load_profile) if len(targets) == 1 else None
+                saved_name = profile_manager.save_profile(target, scan_results, profile_name)
+                print(f"Profile saved: {saved_name}")
+
         # Prepare results for reporting
-        all_results = [{
-            "target": scan_results["target"],
-            "results": scan_results["results"],
-            "timestamp": scan_results["scan_time"]
-        }]
+        all_results = [
+            {
+                "target": scan_results["target"],
+                "results": scan_results["results"],
+                "timestamp": scan_results["scan_time"]
+            }
+            for scan_results in scan_results_list
+        ]
         
         # Generate report
         if all_results:
             reporter = ReportGenerator()
-            report = reporter.generate_report(all_results, format_type=args.format, anonymize=args.anonymize)
-            
+
             if args.save_report:
                 try:
-                    with open(args.save_report, 'w') as f:
+                    # 1 MiB buffer turns the encoder's many small writes
+                    # into a handful of syscalls on multi-MB reports
+                    with open(args.save_report, 'w', buffering=1 << 20) as f:
                         if args.format == "json":
-                            json.dump(report, f, indent=2)
+                            report_data = reporter.build_report_data(
+                                all_results, anonymize=args.anonymize)
+                            write_json_report(report_data, f)
                         else:
-                            f.write(report)
+                            # Stream chunks so the whole document is never
+                            # held in memory at once
+                            for chunk in reporter.iter_report(
+                                    all_results, args.format, anonymize=args.anonymize):
+                                f.write(chunk)
                     print(f"\nReport saved to: {args.save_report}")
                 except Exception as e:
                     print(f"Error saving report: {e}")
             else:
+                report = reporter.generate_report(all_results, format_type=args.format, anonymize=args.anonymize)
                 if args.format == "json":
                     print(json.dumps(report, indent=2))
                 else:
@@ -286,7 +361,7 @@ def main():
             print("No results to report.")
             
     except Exception as e:
-        print(f"Error processing target {target}: {e}")
+        print(f"Error processing targets: {e}")
         if args.debug:
             import traceback
             traceback.print_exc()
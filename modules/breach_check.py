@@ -4,21 +4,41 @@ Checks for email addresses in various data breach databases.
 """
 
 import hashlib
-import requests
+import os
+import shelve
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
-from utils.http_client import HTTPClient
+from utils.cache import cache_path
+from utils.http_client import HTTPClient, get_default_client
+from utils.logger import get_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Breach responses rarely change; cache hits skip API quota and RTTs
+_CACHE_TTL = 24 * 3600
+_CACHE_PATH = cache_path("breach")
 
 
 class BreachScanner:
     """Scanner for data breach checks"""
     
-    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False):
+    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False,
+                 http_client: Optional[HTTPClient] = None):
         """Initialize breach scanner"""
         self.config = config
         self.timeout = timeout
         self.test_mode = test_mode
-        self.http_client = HTTPClient(timeout=timeout)
-        
+        self.http_client = http_client or get_default_client(timeout=timeout)
+        self._memory_cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_enabled = not config.get("no_cache", False)
+
         # API endpoints for breach checks
         self.apis = {
             "haveibeenpwned": {
@@ -38,7 +58,25 @@ class BreachScanner:
                 "requires_key": True
             }
         }
-    
+
+        # Bind each URL template's format method once so the hot path is a
+        # dict lookup plus one call, not a fresh attribute lookup per email
+        for api_config in self.apis.values():
+            api_config["format_url"] = api_config["url"].format
+
+        # APIs without credentials can never answer, so drop them up front
+        # (with one warning) instead of rebuilding and rejecting the request
+        # for every email; simulations still cover every API
+        logger = get_logger("breach")
+        self._active_apis = {}
+        for api_name, api_config in self.apis.items():
+            api_config["ready"] = (not api_config.get("requires_key", False)
+                                   or self._has_credential(api_config))
+            if not api_config["ready"]:
+                logger.warning(f"Skipping {api_name}: no API key configured")
+                continue
+            self._active_apis[api_name] = api_config
+
     def scan(self, target: Dict[str, str], nsfw: bool = False) -> Dict[str, Any]:
         """Scan for data breaches"""
         results = {
@@ -56,34 +94,66 @@ class BreachScanner:
         if not emails:
             return results
         
-        # Check each API for each email
-        for email in emails:
-            for api_name, api_config in self.apis.items():
-                if self.test_mode:
-                    # Simulate breach check in test mode
-                    breach_data = self._simulate_breach_check(email, api_name)
-                else:
-                    breach_data = self._check_breach_api(email, api_config)
-                
-                if api_name not in results["breaches"]:
-                    results["breaches"][api_name] = []
-                
-                if breach_data:
-                    results["breaches"][api_name].append({
-                        "email": email,
-                        "breaches": breach_data,
-                        "checked_at": self._get_timestamp()
-                    })
-                    
-                    # Update summary
-                    results["summary"]["total_breaches"] += len(breach_data)
-                    for breach in breach_data:
-                        results["summary"]["total_records"] += breach.get("pwn_count", 0)
-                
-                results["summary"]["apis_checked"] += 1
-        
+        # Check each API for each email (simulations cover every API)
+        apis = self.apis if self.test_mode else self._active_apis
+        tasks = [
+            (email, api_name, api_config)
+            for email in emails
+            for api_name, api_config in apis.items()
+        ]
+
+        if not tasks:
+            return results
+
+        if self.test_mode:
+            # Simulations are instant; no need for a pool
+            outcomes = {
+                (email, api_name): self._simulate_breach_check(email, api_name)
+                for email, api_name, _ in tasks
+            }
+        else:
+            # Each check is independent network I/O, so fan them out
+            with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as executor:
+                futures = {
+                    executor.submit(self._check_breach_api_cached, email, api_name,
+                                    api_config): (email, api_name)
+                    for email, api_name, api_config in tasks
+                }
+                outcomes = {futures[f]: f.result() for f in as_completed(futures)}
+
+        # One timestamp per scan; the checks above all ran in this burst
+        checked_at = self._get_timestamp()
+
+        # Merge in task order so results are deterministic
+        for email, api_name, _ in tasks:
+            breach_data = outcomes[(email, api_name)]
+
+            if api_name not in results["breaches"]:
+                results["breaches"][api_name] = []
+
+            if breach_data:
+                results["breaches"][api_name].append({
+                    "email": email,
+                    "breaches": breach_data,
+                    "checked_at": checked_at
+                })
+
+                # Update summary
+                results["summary"]["total_breaches"] += len(breach_data)
+                for breach in breach_data:
+                    results["summary"]["total_records"] += breach.get("pwn_count", 0)
+
+            results["summary"]["apis_checked"] += 1
+
         return results
     
+    @staticmethod
+    def _has_credential(api_config: Dict[str, Any]) -> bool:
+        """Return True if the API config carries a usable key"""
+        headers = api_config.get("headers", {})
+        api_key = headers.get("hibp-api-key") or headers.get("Authorization")
+        return bool(api_key) and api_key != "Bearer "
+
     def _extract_emails(self, target: Dict[str, str]) -> List[str]:
         """Extract email addresses from target data"""
         emails = []
@@ -93,23 +163,71 @@ class BreachScanner:
         
         return emails
     
+    def _check_breach_api_cached(self, email: str, api_name: str,
+                                 api_config: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Check a breach API through the TTL cache
+
+        Keys are (api, sha1(email)) so the cache never stores addresses in
+        the clear. Known negatives (empty lists) are cached too; errors
+        (None) are not, so transient failures get retried. Disabled
+        entirely via the no_cache config key (--no-cache).
+        """
+        if not self._cache_enabled:
+            return self._check_breach_api(email, api_config)
+
+        key = f"{api_name}:{hashlib.sha1(email.lower().encode()).hexdigest()}"
+        now = time.time()
+
+        hit = self._memory_cache.get(key)
+        if hit and now - hit[0] < _CACHE_TTL:
+            return hit[1]
+
+        with self._cache_lock:
+            try:
+                with shelve.open(_CACHE_PATH) as db:
+                    hit = db.get(key)
+            except OSError:
+                hit = None
+        if hit and now - hit[0] < _CACHE_TTL:
+            self._memory_cache[key] = hit
+            return hit[1]
+
+        breach_data = self._check_breach_api(email, api_config)
+
+        if breach_data is not None:
+            entry = (now, breach_data)
+            self._memory_cache[key] = entry
+            with self._cache_lock:
+                try:
+                    os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+                    with shelve.open(_CACHE_PATH) as db:
+                        db[key] = entry
+                except OSError:
+                    pass
+
+        return breach_data
+
     def _check_breach_api(self, email: str, api_config: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """Check email against a breach API"""
         try:
-            url = api_config["url"].format(email)
+            # Credential presence was decided once at init
+            if not api_config.get("ready", True):
+                return None
+
+            format_url = api_config.get("format_url") or api_config["url"].format
+            url = format_url(email)
             headers = api_config.get("headers", {})
-            
-            # Skip if API key is required but not provided
-            if api_config.get("requires_key", False):
-                api_key = headers.get("hibp-api-key") or headers.get("Authorization")
-                if not api_key or api_key == "Bearer ":
-                    return None
-            
+
             response = self.http_client.get(url, headers=headers)
             
             if response.status_code == 200:
-                data = response.json()
-                
+                # orjson parses large breach bodies several times faster
+                # than the stdlib decoder behind response.json()
+                if orjson is not None:
+                    data = orjson.loads(response.content)
+                else:
+                    data = response.json()
+
                 if api_config["url"].startswith("https://haveibeenpwned.com"):
                     return self._parse_hibp_response(data)
                 elif api_config["url"].startswith("https://api.dehashed.com"):
@@ -127,34 +245,31 @@ class BreachScanner:
     
     def _parse_hibp_response(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Parse HaveIBeenPwned API response"""
-        breaches = []
-        for breach in data:
-            breaches.append({
+        return [
+            {
                 "name": breach.get("Name", ""),
                 "domain": breach.get("Domain", ""),
                 "breach_date": breach.get("BreachDate", ""),
                 "pwn_count": breach.get("PwnCount", 0),
                 "description": breach.get("Description", ""),
                 "data_classes": breach.get("DataClasses", [])
-            })
-        return breaches
-    
+            }
+            for breach in data
+        ]
+
     def _parse_dehashed_response(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Parse Dehashed API response"""
-        breaches = []
-        entries = data.get("entries", [])
-        
-        for entry in entries:
-            breaches.append({
+        return [
+            {
                 "email": entry.get("email", ""),
                 "username": entry.get("username", ""),
                 "password": entry.get("password", ""),
                 "hash": entry.get("hash", ""),
                 "database": entry.get("database_name", ""),
                 "breach_date": entry.get("date", "")
-            })
-        
-        return breaches
+            }
+            for entry in data.get("entries", [])
+        ]
     
     def _simulate_breach_check(self, email: str, api_name: str) -> List[Dict[str, Any]]:
         """Simulate breach check for test mode"""
@@ -185,7 +300,6 @@ class BreachScanner:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_description(self) -> str:
@@ -3,23 +3,46 @@ Domain Intelligence Scanner
 Performs WHOIS lookup, DNS checks, and domain analysis.
 """
 
-import requests
-import socket
-import dns.resolver
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
-from utils.http_client import HTTPClient
+from utils.http_client import HTTPClient, get_default_client
+
+# Shared resolver so /etc/resolv.conf is parsed once per process; the
+# LRU cache answers repeat lookups (e.g. the same domain across targets)
+# without another network round trip. Created lazily because importing
+# dns.resolver pulls in dozens of modules the CLI may never need.
+_RESOLVER = None
+
+
+def _get_resolver():
+    """Build the shared DNS resolver on first use"""
+    global _RESOLVER
+    if _RESOLVER is None:
+        import dns.resolver
+        _RESOLVER = dns.resolver.Resolver()
+        _RESOLVER.cache = dns.resolver.LRUCache(max_size=10000)
+    return _RESOLVER
+
+# Record types queried by default: the ones downstream reporting actually
+# uses. CNAME and SOA can be requested via the dns_record_types config key.
+_DEFAULT_DNS_RECORD_TYPES = ("A", "AAAA", "MX", "NS", "TXT")
 
 
 class DomainScanner:
     """Scanner for domain intelligence"""
     
-    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False):
+    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False,
+                 http_client: Optional[HTTPClient] = None):
         """Initialize domain scanner"""
         self.config = config
         self.timeout = timeout
         self.test_mode = test_mode
-        self.http_client = HTTPClient(timeout=timeout)
-        
+        self.http_client = http_client or get_default_client(timeout=timeout)
+        self._ssl_cache: Dict[tuple, tuple] = {}
+        self.record_types = tuple(config.get("dns_record_types") or _DEFAULT_DNS_RECORD_TYPES)
+
         # Domain intelligence services
         self.services = {
             "whois": {
@@ -57,13 +80,16 @@ class DomainScanner:
         if not domains:
             return results
         
+        # One timestamp per scan; the loop below runs in a single burst
+        checked_at = self._get_timestamp()
+
         # Process each domain
         for domain in domains:
             domain_results = {
                 "whois": {},
                 "dns": {},
                 "ssl": {},
-                "checked_at": self._get_timestamp()
+                "checked_at": checked_at
             }
             
             # WHOIS lookup
@@ -110,13 +136,15 @@ class DomainScanner:
         if target.get("domain"):
             domains.append(target["domain"])
         
-        # Extract from email
-        if target.get("email"):
+        # Extract from email (precomputed on TargetView; derived for raw dicts)
+        email_domain = target.get("email_domain")
+        if email_domain is None and target.get("email"):
             email_domain = target["email"].split("@")[1]
+        if email_domain:
             domains.append(email_domain)
         
-        # Remove duplicates
-        return list(set(domains))
+        # Remove duplicates, preserving first-seen order
+        return list(dict.fromkeys(domains))
     
     def _get_whois_info(self, domain: str) -> Optional[Dict[str, Any]]:
         """Get WHOIS information for a domain"""
@@ -159,25 +187,31 @@ class DomainScanner:
     def _get_dns_records(self, domain: str) -> Optional[Dict[str, Any]]:
         """Get DNS records for a domain"""
         try:
+            import dns.resolver
+
+            resolver = _get_resolver()
             records = {}
-            
-            # Common DNS record types
-            record_types = ["A", "AAAA", "MX", "NS", "TXT", "CNAME", "SOA"]
-            
-            for record_type in record_types:
+
+            # Resolve all record types concurrently: 1 RTT instead of 7
+            def resolve_one(record_type):
                 try:
-                    answers = dns.resolver.resolve(domain, record_type)
-                    records[record_type] = [str(answer) for answer in answers]
-                except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.NoNameservers):
-                    continue
+                    answers = resolver.resolve(domain, record_type, lifetime=self.timeout)
+                    return [str(answer) for answer in answers]
+                except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer,
+                        dns.resolver.NoNameservers, dns.exception.Timeout):
+                    return None
+
+            with ThreadPoolExecutor(max_workers=len(self.record_types)) as executor:
+                answers_by_type = executor.map(resolve_one, self.record_types)
+
+            for record_type, answers in zip(self.record_types, answers_by_type):
+                if answers is not None:
+                    records[record_type] = answers
             
             # SPF record (usually in TXT)
-            spf_records = []
-            if "TXT" in records:
-                for txt_record in records["TXT"]:
-                    if txt_record.startswith("v=spf1"):
-                        spf_records.append(txt_record)
-            
+            spf_records = [r for r in records.get("TXT", ()) if r.startswith("v=spf1")]
+
+
             return {
                 "records": records,
                 "spf_records": spf_records,
@@ -189,17 +223,22 @@ class DomainScanner:
     
     def _get_ssl_certificate(self, domain: str) -> Optional[Dict[str, Any]]:
         """Get SSL certificate information"""
+        # A TLS handshake costs ~2 RTTs plus crypto; reuse the parsed cert
+        # when the same host shows up again (e.g. --domain and email domain)
+        cached = self._ssl_cache.get((domain, 443))
+        if cached and time.monotonic() - cached[0] < 3600:
+            return cached[1]
+
         try:
             import ssl
             import socket
-            from datetime import datetime
-            
+
             context = ssl.create_default_context()
             with socket.create_connection((domain, 443), timeout=self.timeout) as sock:
                 with context.wrap_socket(sock, server_hostname=domain) as ssock:
                     cert = ssock.getpeercert()
-                    
-                    return {
+
+                    cert_info = {
                         "subject": dict(x[0] for x in cert["subject"]),
                         "issuer": dict(x[0] for x in cert["issuer"]),
                         "version": cert["version"],
@@ -209,7 +248,10 @@ class DomainScanner:
                         "san": cert.get("subjectAltName", []),
                         "signature_algorithm": cert.get("signatureAlgorithm", "")
                     }
-            
+
+                    self._ssl_cache[(domain, 443)] = (time.monotonic(), cert_info)
+                    return cert_info
+
         except Exception as e:
             return None
     
@@ -260,7 +302,6 @@ class DomainScanner:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_description(self) -> str:
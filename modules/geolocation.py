@@ -3,22 +3,87 @@ Geolocation Scanner
 Infers location from various data sources and metadata.
 """
 
-import requests
+import hashlib
+import json
+import os
 import re
+import shelve
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
-from utils.http_client import HTTPClient
+from utils.cache import cache_path
+from utils.http_client import HTTPClient, get_default_client, get_fast_client, safe_none
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_response(response):
+    """Decode a JSON response body, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _loads_bytes(payload: bytes):
+    """Decode a raw JSON payload, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+# Compiled once; matching is a single C call per use
+_IP_RE = re.compile(r"\b(?:\d{1,3}\.){3}\d{1,3}\b")
+_EMAIL_DOMAIN_RE = re.compile(r"@([\w.\-]+)$")
+
+# Geolocation data changes on the order of days; cache hits for repeat
+# targets skip the provider round trip entirely
+_GEO_CACHE_TTL = 600
+
+# On-disk tier so repeat scans across process restarts skip the network
+# too. TTLs vary by kind: IP assignments shift within a day, phone
+# prefix data is near-static, domain results track DNS and move fastest.
+_DISK_CACHE_TTLS = {"ip": 24 * 3600, "phone": 7 * 24 * 3600, "domain": 3600}
+_DISK_CACHE_PATH = cache_path("geo")
+
+# Hostname -> (ip, resolved_at); shared across scanner instances because
+# A records for the same host rarely change within the TTL
+_DNS_CACHE: Dict[str, tuple] = {}
+
+
+def cached_gethostbyname(host: str, ttl: int = 300) -> str:
+    """Resolve a hostname, reusing recent results instead of hitting the
+    OS resolver for every scan"""
+    import socket
+
+    cached = _DNS_CACHE.get(host)
+    now = time.monotonic()
+    if cached and now - cached[1] < ttl:
+        return cached[0]
+
+    ip_address = socket.gethostbyname(host)
+    _DNS_CACHE[host] = (ip_address, now)
+    return ip_address
 
 
 class GeolocationScanner:
     """Scanner for geolocation inference"""
     
-    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False):
+    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False,
+                 http_client: Optional[HTTPClient] = None):
         """Initialize geolocation scanner"""
         self.config = config
         self.timeout = timeout
         self.test_mode = test_mode
-        self.http_client = HTTPClient(timeout=timeout)
-        
+        self.http_client = http_client or get_default_client(timeout=timeout)
+        self._geo_cache: Dict[tuple, tuple] = {}
+        self._disk_lock = threading.Lock()
+        self._cache_enabled = not config.get("no_cache", False)
+
         # Geolocation services
         self.services = {
             "ip_geolocation": {
@@ -36,8 +101,23 @@ class GeolocationScanner:
                 "url": "https://api.ipapi.com/{}",
                 "method": "GET",
                 "requires_key": False
+            },
+            "ip_geolocation_batch": {
+                "url": "http://ip-api.com/batch",
+                "method": "POST",
+                "requires_key": False
             }
         }
+
+        # Bind the URL template's format method once so the per-IP hot
+        # path skips the dict-chain and template reparse
+        self._ip_url_fmt = self.services["ip_geolocation"]["url"].format
+
+        # Per-IP lookups are the tightest loop this scanner has; the
+        # shared urllib3-backed client skips the Session/PreparedRequest
+        # machinery requests adds on every call. HTTPClient stays in
+        # place for the other, lower-volume paths.
+        self._fast_client = get_fast_client(timeout=timeout)
     
     def scan(self, target: Dict[str, str], nsfw: bool = False) -> Dict[str, Any]:
         """Scan for geolocation intelligence"""
@@ -56,18 +136,40 @@ class GeolocationScanner:
         if not location_data:
             return results
         
-        # Process each data type
-        for data_type, data_value in location_data.items():
-            if self.test_mode:
-                location_info = self._simulate_geolocation(data_type, data_value)
-            else:
-                location_info = self._get_geolocation(data_type, data_value)
-            
+        # Geolocate every IP the scan will touch in one batch request so
+        # the per-type lookups below start from a warm cache
+        if not self.test_mode:
+            self._prewarm_ip_cache(location_data)
+
+        # Each data type hits an independent provider, so fan the lookups
+        # out across threads and merge in input order
+        items = list(location_data.items())
+
+        if self.test_mode:
+            # Simulations are instant; no need for a pool
+            outcomes = {
+                data_type: self._simulate_geolocation(data_type, data_value)
+                for data_type, data_value in items
+            }
+        else:
+            with ThreadPoolExecutor(max_workers=len(items)) as executor:
+                futures = {
+                    executor.submit(self._get_geolocation, data_type, data_value): data_type
+                    for data_type, data_value in items
+                }
+                outcomes = {futures[f]: f.result() for f in as_completed(futures)}
+
+        # One timestamp per scan; the lookups above all ran in this burst
+        checked_at = self._get_timestamp()
+
+        for data_type, data_value in items:
+            location_info = outcomes[data_type]
+
             if location_info:
                 results["locations"][data_type] = {
                     "source": data_value,
                     "location": location_info,
-                    "checked_at": self._get_timestamp()
+                    "checked_at": checked_at
                 }
                 
                 results["summary"]["total_locations"] += 1
@@ -98,10 +200,13 @@ class GeolocationScanner:
         if target.get("domain"):
             location_data["domain"] = target["domain"]
         
-        # Extract IP from email domain (simulated)
-        if target.get("email"):
-            domain = target["email"].split("@")[1]
-            location_data["email_domain"] = domain
+        # Email domain (precomputed on TargetView; derived here for raw dicts)
+        email_domain = target.get("email_domain")
+        if email_domain is None and target.get("email"):
+            match = _EMAIL_DOMAIN_RE.search(target["email"])
+            email_domain = match.group(1) if match else None
+        if email_domain:
+            location_data["email_domain"] = email_domain
         
         return location_data
     
@@ -121,72 +226,183 @@ class GeolocationScanner:
             # Log error but don't fail the entire scan
             return None
     
-    def _get_ip_geolocation(self, ip_address: str) -> Optional[Dict[str, Any]]:
-        """Get geolocation from IP address"""
-        try:
-            url = self.services["ip_geolocation"]["url"].format(ip_address)
-            response = self.http_client.get(url)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "country": data.get("country_name", ""),
-                    "region": data.get("region", ""),
-                    "city": data.get("city", ""),
-                    "latitude": data.get("latitude", 0),
-                    "longitude": data.get("longitude", 0),
-                    "timezone": data.get("timezone", ""),
-                    "isp": data.get("org", ""),
-                    "confidence": "high"
-                }
-            
+    @staticmethod
+    def _disk_key(key: tuple) -> str:
+        """Build the persistent cache key; values are hashed so the store
+        never holds IPs or phone numbers in the clear"""
+        kind, value = key
+        return f"{kind}:{hashlib.sha1(value.lower().encode()).hexdigest()}"
+
+    def _cache_get(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached lookup from memory or, failing that, disk
+
+        Disabled entirely via the no_cache config key (--no-cache).
+        """
+        if not self._cache_enabled:
             return None
-            
-        except Exception as e:
+
+        cached = self._geo_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _GEO_CACHE_TTL:
+            return cached[1]
+
+        ttl = _DISK_CACHE_TTLS.get(key[0])
+        if ttl is None:
             return None
-    
+        with self._disk_lock:
+            try:
+                with shelve.open(_DISK_CACHE_PATH) as db:
+                    hit = db.get(self._disk_key(key))
+            except OSError:
+                return None
+        if hit and time.time() - hit[0] < ttl:
+            self._geo_cache[key] = (time.monotonic(), hit[1])
+            return hit[1]
+        return None
+
+    def _cache_put(self, key: tuple, value: Dict[str, Any]) -> Dict[str, Any]:
+        """Store a lookup result in both cache tiers and return it"""
+        if not self._cache_enabled:
+            return value
+
+        self._geo_cache[key] = (time.monotonic(), value)
+        if key[0] in _DISK_CACHE_TTLS:
+            with self._disk_lock:
+                try:
+                    os.makedirs(os.path.dirname(_DISK_CACHE_PATH), exist_ok=True)
+                    with shelve.open(_DISK_CACHE_PATH) as db:
+                        db[self._disk_key(key)] = (time.time(), value)
+                except OSError:
+                    pass
+        return value
+
+    def _prewarm_ip_cache(self, location_data: Dict[str, str]) -> None:
+        """Batch-geolocate the distinct IPs a scan will need
+
+        The batch results only reach the per-type lookups through the
+        cache, so with caching disabled the prewarm would be one wasted
+        request per scan; skip it.
+        """
+        if not self._cache_enabled:
+            return
+
+        ips = []
+        if location_data.get("ip"):
+            ips.append(location_data["ip"])
+
+        for key in ("domain", "email_domain"):
+            host = location_data.get(key)
+            if host:
+                try:
+                    ips.append(cached_gethostbyname(host))
+                except OSError:
+                    continue
+
+        pending = [ip for ip in dict.fromkeys(ips) if self._cache_get(("ip", ip)) is None]
+        if len(pending) > 1:
+            self._get_ip_geolocation_batch(pending)
+
+    def _get_ip_geolocation_batch(self, ips: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Geolocate up to 100 IPs per request via the batch endpoint
+
+        Each located IP is written into the TTL cache, so subsequent
+        single-IP lookups are served from memory.
+        """
+        url = self.services["ip_geolocation_batch"]["url"]
+        located = {}
+
+        for start in range(0, len(ips), 100):
+            chunk = ips[start:start + 100]
+            try:
+                response = self.http_client.post(url, json=chunk)
+                if response.status_code != 200:
+                    continue
+
+                for ip_address, entry in zip(chunk, _loads_response(response)):
+                    if isinstance(entry, dict) and entry.get("status") == "success":
+                        located[ip_address] = self._cache_put(("ip", ip_address), {
+                            "country": entry.get("country", ""),
+                            "region": entry.get("regionName", ""),
+                            "city": entry.get("city", ""),
+                            "latitude": entry.get("lat", 0),
+                            "longitude": entry.get("lon", 0),
+                            "timezone": entry.get("timezone", ""),
+                            "isp": entry.get("isp", ""),
+                            "confidence": "high"
+                        })
+            except Exception as e:
+                # Fall back to per-IP lookups for anything not located
+                continue
+
+        return located
+
+    @safe_none
+    def _get_ip_geolocation(self, ip_address: str) -> Optional[Dict[str, Any]]:
+        """Get geolocation from IP address"""
+        cached = self._cache_get(("ip", ip_address))
+        if cached is not None:
+            return cached
+
+        url = self._ip_url_fmt(ip_address)
+        response = self._fast_client.get(url)
+
+        if response.status_code == 200:
+            data = _loads_bytes(response.content)
+            return self._cache_put(("ip", ip_address), {
+                "country": data.get("country_name", ""),
+                "region": data.get("region", ""),
+                "city": data.get("city", ""),
+                "latitude": data.get("latitude", 0),
+                "longitude": data.get("longitude", 0),
+                "timezone": data.get("timezone", ""),
+                "isp": data.get("org", ""),
+                "confidence": "high"
+            })
+
+        return None
+
+    @safe_none
     def _get_phone_geolocation(self, phone_number: str) -> Optional[Dict[str, Any]]:
         """Get geolocation from phone number"""
-        try:
-            url = self.services["phone_geolocation"]["url"]
-            params = {
-                "phone": phone_number
-            }
-            
-            api_key = self.services["phone_geolocation"].get("api_key", "")
-            if api_key:
-                params["key"] = api_key
-            
-            response = self.http_client.get(url, params=params)
-            
-            if response.status_code == 200:
-                data = response.json()
-                return {
-                    "country": data.get("country", ""),
-                    "region": data.get("region", ""),
-                    "carrier": data.get("carrier", ""),
-                    "type": data.get("type", ""),
-                    "confidence": "medium"
-                }
-            
-            return None
-            
-        except Exception as e:
-            return None
-    
+        cached = self._cache_get(("phone", phone_number))
+        if cached is not None:
+            return cached
+
+        url = self.services["phone_geolocation"]["url"]
+        params = {
+            "phone": phone_number
+        }
+
+        api_key = self.services["phone_geolocation"].get("api_key", "")
+        if api_key:
+            params["key"] = api_key
+
+        response = self.http_client.get(url, params=params)
+
+        if response.status_code == 200:
+            data = _loads_response(response)
+            return self._cache_put(("phone", phone_number), {
+                "country": data.get("country", ""),
+                "region": data.get("region", ""),
+                "carrier": data.get("carrier", ""),
+                "type": data.get("type", ""),
+                "confidence": "medium"
+            })
+
+        return None
+
+    @safe_none
     def _get_domain_geolocation(self, domain: str) -> Optional[Dict[str, Any]]:
         """Get geolocation from domain"""
-        try:
-            # First, resolve domain to IP
-            import socket
-            try:
-                ip_address = socket.gethostbyname(domain)
-                return self._get_ip_geolocation(ip_address)
-            except socket.gaierror:
-                return None
-            
-        except Exception as e:
-            return None
+        cached = self._cache_get(("domain", domain))
+        if cached is not None:
+            return cached
+
+        # Resolve the domain first; gaierror degrades to None via safe_none
+        ip_address = cached_gethostbyname(domain)
+        location_info = self._get_ip_geolocation(ip_address)
+        if location_info is not None:
+            return self._cache_put(("domain", domain), location_info)
+        return None
     
     def _simulate_geolocation(self, data_type: str, data_value: str) -> Dict[str, Any]:
         """Simulate geolocation for test mode"""
@@ -225,7 +441,6 @@ class GeolocationScanner:
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_description(self) -> str:
@@ -3,21 +3,52 @@ Public Records Scanner
 Searches public records, court records, and people directories.
 """
 
+import hashlib
+import os
 import requests
+import shelve
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
-from utils.http_client import HTTPClient
+from utils.cache import cache_path
+from utils.http_client import HTTPClient, get_default_client
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads_response(response):
+    """Decode a JSON response body, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+# Public records change slowly; a day-old answer is as good as a fresh
+# one, and scans re-run across days hit disk instead of provider quota
+_CACHE_TTL = 24 * 3600
+_CACHE_PATH = cache_path("public_records")
 
 
 class PublicRecordsScanner:
     """Scanner for public records"""
     
-    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False):
+    def __init__(self, config: Dict[str, Any], timeout: int = 30, test_mode: bool = False,
+                 http_client: Optional[HTTPClient] = None):
         """Initialize public records scanner"""
         self.config = config
         self.timeout = timeout
         self.test_mode = test_mode
-        self.http_client = HTTPClient(timeout=timeout)
-        
+        self.http_client = http_client or get_default_client(timeout=timeout)
+        self._memory_cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_enabled = not config.get("no_cache", False)
+
         # Public records sources
         self.sources = {
             "people_finder": {
@@ -33,7 +64,28 @@ class PublicRecordsScanner:
                 "api_key": config.get("courtlistener_api_key", "")
             }
         }
-    
+
+        # Build the constant part of each request payload once; per-term
+        # calls only merge in the search value
+        for source_config in self.sources.values():
+            if source_config["method"] == "GET":
+                base = {"format": "json"}
+                if source_config.get("api_key"):
+                    base["key"] = source_config["api_key"]
+            else:
+                base = {}
+                if source_config.get("api_key"):
+                    base["api_key"] = source_config["api_key"]
+            source_config["base_payload"] = base
+
+        # Sources without credentials can never answer; decide once here
+        # instead of per scan (simulations still cover every source)
+        self._enabled_sources = {
+            name: source_config
+            for name, source_config in self.sources.items()
+            if self._has_credential(source_config)
+        }
+
     def scan(self, target: Dict[str, str], nsfw: bool = False) -> Dict[str, Any]:
         """Scan public records"""
         results = {
@@ -50,20 +102,49 @@ class PublicRecordsScanner:
         if not search_terms:
             return results
         
-        # Search each source
-        for source_name, source_config in self.sources.items():
-            if self.test_mode:
-                # Simulate public records search in test mode
-                records = self._simulate_public_search(search_terms, source_name)
-            else:
-                records = self._search_public_records(search_terms, source_config)
-            
+        # Every (source, term) pair is an independent request, so fan the
+        # product out across threads and bucket results back per source
+        sources = self.sources if self.test_mode else self._enabled_sources
+
+        if self.test_mode:
+            # Simulations are instant; no need for a pool
+            outcomes = {
+                source_name: self._simulate_public_search(search_terms, source_name)
+                for source_name in sources
+            }
+        else:
+            tasks = [
+                (source_name, source_config, term)
+                for source_name, source_config in sources.items()
+                for term in search_terms
+            ]
+
+            pair_outcomes = {}
+            if tasks:
+                with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as executor:
+                    futures = {
+                        executor.submit(self._search_one_cached, source_config,
+                                        term): (source_name, term["source"])
+                        for source_name, source_config, term in tasks
+                    }
+                    pair_outcomes = {futures[f]: f.result() for f in as_completed(futures)}
+
+            outcomes = {}
+            for source_name in sources:
+                records = []
+                for term in search_terms:
+                    records.extend(pair_outcomes.get((source_name, term["source"])) or [])
+                outcomes[source_name] = records
+
+        for source_name in sources:
+            records = outcomes[source_name]
+
             if records:
                 results["records"][source_name] = records
                 results["summary"]["total_records"] += len(records)
-            
+
             results["summary"]["sources_checked"] += 1
-        
+
         return results
     
     def _extract_search_terms(self, target: Dict[str, str]) -> List[Dict[str, str]]:
@@ -96,75 +177,127 @@ class PublicRecordsScanner:
         
         return terms
     
-    def _search_public_records(self, search_terms: List[Dict[str, str]], 
+    @staticmethod
+    def _has_credential(source_config: Dict[str, Any]) -> bool:
+        """Return True if the source config carries a usable key"""
+        return not source_config.get("requires_key", False) or bool(source_config.get("api_key"))
+
+    def _search_public_records(self, search_terms: List[Dict[str, str]],
                               source_config: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
         """Search public records using a specific source"""
+        # Skip if API key is required but not provided
+        if not self._has_credential(source_config):
+            return None
+
+        records = []
+        for term in search_terms:
+            records.extend(self._search_one_cached(source_config, term) or [])
+
+        return records
+
+    def _search_one_cached(self, source_config: Dict[str, Any],
+                           term: Dict[str, str]) -> Optional[List[Dict[str, Any]]]:
+        """Run a single search through the TTL cache
+
+        Keys hash the search value so the store never holds names or
+        emails in the clear. Known-empty results are cached too; errors
+        (None) are not, so transient failures get retried. Disabled
+        entirely via the no_cache config key (--no-cache).
+        """
+        if not self._cache_enabled:
+            return self._search_one(source_config, term)
+
+        digest = hashlib.sha1(term["value"].lower().encode()).hexdigest()
+        key = f"{source_config['url']}:{term['type']}:{digest}"
+        now = time.time()
+
+        hit = self._memory_cache.get(key)
+        if hit and now - hit[0] < _CACHE_TTL:
+            return hit[1]
+
+        with self._cache_lock:
+            try:
+                with shelve.open(_CACHE_PATH) as db:
+                    hit = db.get(key)
+            except OSError:
+                hit = None
+        if hit and now - hit[0] < _CACHE_TTL:
+            self._memory_cache[key] = hit
+            return hit[1]
+
+        records = self._search_one(source_config, term)
+
+        if records is not None:
+            entry = (now, records)
+            self._memory_cache[key] = entry
+            with self._cache_lock:
+                try:
+                    os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+                    with shelve.open(_CACHE_PATH) as db:
+                        db[key] = entry
+                except OSError:
+                    pass
+
+        return records
+
+    def _search_one(self, source_config: Dict[str, Any],
+                    term: Dict[str, str]) -> Optional[List[Dict[str, Any]]]:
+        """Run a single search term against a single source"""
         try:
-            # Skip if API key is required but not provided
-            if source_config.get("requires_key", False):
-                api_key = source_config.get("api_key", "")
-                if not api_key:
-                    return None
-            
-            records = []
-            
-            for term in search_terms:
-                if source_config["method"] == "GET":
-                    params = {
-                        "q": term["value"],
-                        "format": "json"
-                    }
-                    if source_config.get("api_key"):
-                        params["key"] = source_config["api_key"]
-                    
-                    response = self.http_client.get(source_config["url"], params=params)
-                    
-                elif source_config["method"] == "POST":
-                    data = {
-                        "query": term["value"],
-                        "type": term["type"]
-                    }
-                    if source_config.get("api_key"):
-                        data["api_key"] = source_config["api_key"]
-                    
-                    response = self.http_client.post(source_config["url"], json=data)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    parsed_records = self._parse_records_response(data, term)
-                    records.extend(parsed_records)
-            
-            return records
-            
+            if source_config["method"] == "GET":
+                params = {**source_config["base_payload"], "q": term["value"]}
+                response = self.http_client.get(source_config["url"], params=params)
+
+            elif source_config["method"] == "POST":
+                data = {**source_config["base_payload"],
+                        "query": term["value"], "type": term["type"]}
+                response = self.http_client.post(source_config["url"], json=data)
+
+            else:
+                return None
+
+            if response.status_code == 200:
+                return self._parse_records_response(_loads_response(response), term)
+
+            return []
+
         except Exception as e:
             # Log error but don't fail the entire scan
             return None
     
     def _parse_records_response(self, data: Dict[str, Any], search_term: Dict[str, str]) -> List[Dict[str, Any]]:
         """Parse public records API response"""
-        records = []
-        
         # Generic parsing - adapt based on actual API response structure
-        if isinstance(data, dict):
-            results = data.get("results", data.get("data", []))
-            
-            for result in results:
-                record = {
-                    "search_term": search_term["value"],
-                    "search_type": search_term["type"],
-                    "source": search_term["source"],
-                    "data": result,
-                    "found_at": self._get_timestamp()
-                }
-                records.append(record)
-        
-        return records
+        if not isinstance(data, dict):
+            return []
+
+        # `or` short-circuits, so the "data" fallback is only probed when
+        # "results" is genuinely absent or empty
+        results = data.get("results") or data.get("data") or []
+
+        # One timestamp per response, not one per record; term fields are
+        # hoisted so the loop body is pure dict construction
+        found_at = self._get_timestamp()
+        value, search_type, source = (search_term["value"], search_term["type"],
+                                      search_term["source"])
+
+        return [
+            {
+                "search_term": value,
+                "search_type": search_type,
+                "source": source,
+                "data": result,
+                "found_at": found_at
+            }
+            for result in results
+        ]
     
     def _simulate_public_search(self, search_terms: List[Dict[str, str]], 
                                source_name: str) -> List[Dict[str, Any]]:
         """Simulate public records search for test mode"""
         records = []
-        
+        found_at = self._get_timestamp()
+
         for term in search_terms:
             if source_name == "people_finder":
                 records.append({
@@ -179,7 +312,7 @@ class PublicRecordsScanner:
                         "age": "35",
                         "relatives": ["Jane Doe", "Bob Doe"]
                     },
-                    "found_at": self._get_timestamp()
+                    "found_at": found_at
                 })
             elif source_name == "court_records":
                 records.append({
@@ -194,14 +327,13 @@ class PublicRecordsScanner:
                         "parties": ["John Doe", "Jane Smith"],
                         "status": "Closed"
                     },
-                    "found_at": self._get_timestamp()
+                    "found_at": found_at
                 })
         
         return records
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_description(self) -> str:
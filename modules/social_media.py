@@ -3,25 +3,75 @@ Social Media Scanner
 Searches for presence on various social media platforms.
 """
 
+import hashlib
+import os
 import requests
 import re
+import shelve
+import socket
+import threading
+import time
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Any, Optional
-from urllib.parse import quote_plus
-from utils.http_client import HTTPClient
+from urllib.parse import quote_plus, urlsplit
+from utils.cache import cache_path
+from utils.http_client import HTTPClient, get_default_client
+
+# Compiled once at import; extraction then matches without re-parsing
+# the patterns per scan
+_EMAIL_LOCAL_RE = re.compile(r"^([^@\s]+)@")
+_NAME_TOKEN_RE = re.compile(r"[A-Za-z]+")
+
+# Profiles rarely appear or vanish within a day; re-runs against the
+# same usernames (e.g. --update-profile) skip the network on a hit.
+# Negative results are cached too — that is most of the win, since
+# most guessed usernames exist on no platform.
+_CHECK_CACHE_TTL = 24 * 3600
+_CACHE_PATH = cache_path("social")
+
+# Platforms reported as "found" in test mode; a frozenset built once
+# instead of a list literal allocated per simulated check
+_TEST_FOUND_PLATFORMS = frozenset({"twitter", "github", "linkedin"})
+
+
+def _any_username(username: str) -> bool:
+    """Fallback rule for platforms without documented username limits"""
+    return True
+
+
+# Each platform's allowed username shape; a candidate that violates the
+# rule is a guaranteed 404, so the pair is pruned before any request.
+# Bound fullmatch methods keep the per-pair check a single C call.
+_USERNAME_RULES = {
+    "twitter": re.compile(r"\w{1,15}").fullmatch,
+    "instagram": re.compile(r"[A-Za-z0-9._]{1,30}").fullmatch,
+    "facebook": re.compile(r"[A-Za-z0-9.]{5,50}").fullmatch,
+    "tiktok": re.compile(r"[\w.]{2,24}").fullmatch,
+    "reddit": re.compile(r"[\w\-]{3,20}").fullmatch,
+    "github": re.compile(r"[A-Za-z0-9\-]{1,39}").fullmatch,
+}
 
 
 class SocialMediaScanner:
     """Scanner for social media presence"""
     
-    def __init__(self, config: Dict[str, Any], timeout: int = 30, 
-                 headless: bool = False, test_mode: bool = False):
+    def __init__(self, config: Dict[str, Any], timeout: int = 30,
+                 headless: bool = False, test_mode: bool = False,
+                 http_client: Optional[HTTPClient] = None):
         """Initialize social media scanner"""
         self.config = config
         self.timeout = timeout
         self.headless = headless
         self.test_mode = test_mode
-        self.http_client = HTTPClient(timeout=timeout)
-        
+        self.http_client = http_client or get_default_client(timeout=timeout)
+        self._memory_cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._cache_enabled = not config.get("no_cache", False)
+        # (platform, username) -> (etag, last_modified) captured from the
+        # most recent 200 response; consumed by the cache wrapper
+        self._response_validators: Dict[tuple, tuple] = {}
+
         # Social media platforms
         self.platforms = {
             "twitter": {
@@ -70,6 +120,31 @@ class SocialMediaScanner:
                 "success_codes": [200]
             }
         }
+
+        # Bind each URL template's format method and freeze the success
+        # codes once, so the per-check hot path is a dict lookup plus one
+        # call instead of template reparsing and a list scan
+        self._url_builders = {
+            name: platform_config["url"].format
+            for name, platform_config in self.platforms.items()
+        }
+        self._success_sets = {
+            name: frozenset(platform_config["success_codes"])
+            for name, platform_config in self.platforms.items()
+        }
+        for name, platform_config in self.platforms.items():
+            platform_config["username_filter"] = _USERNAME_RULES.get(name, _any_username)
+
+        # Deferred until the first real scan so constructing a scanner
+        # (e.g. in test mode) never touches the network
+        self._dns_prewarmed = False
+
+        # At most 4 in-flight requests per platform host: cross-platform
+        # checks still run fully parallel, but no single site gets
+        # dogpiled into rate-limiting us (each platform is one host)
+        self._host_sems = {
+            name: threading.BoundedSemaphore(4) for name in self.platforms
+        }
     
     def scan(self, target: Dict[str, str], nsfw: bool = False) -> Dict[str, Any]:
         """Scan for social media presence"""
@@ -88,86 +163,223 @@ class SocialMediaScanner:
         if not usernames:
             return results
         
-        # Check each platform for each username
-        for username in usernames:
-            for platform_name, platform_config in self.platforms.items():
-                if self.test_mode:
-                    # Simulate results in test mode
-                    found = self._simulate_social_check(username, platform_name)
-                else:
-                    found = self._check_platform(username, platform_config)
-                
-                if platform_name not in results["platforms"]:
-                    results["platforms"][platform_name] = []
-                
-                profile_info = {
-                    "username": username,
-                    "url": platform_config["url"].format(username),
-                    "found": found,
-                    "checked_at": self._get_timestamp()
+        # Every (username, platform) pair is an independent status check,
+        # so fan them out across threads and merge in input order. Pairs
+        # the platform's username rules rule out are dropped up front.
+        tasks = [
+            (username, platform_name, platform_config)
+            for username in usernames
+            for platform_name, platform_config in self.platforms.items()
+            if platform_config["username_filter"](username)
+        ]
+
+        if self.test_mode:
+            # Simulations are instant; no need for a pool
+            outcomes = {
+                (username, platform_name): self._simulate_social_check(username, platform_name)
+                for username, platform_name, _ in tasks
+            }
+        else:
+            self._prewarm_dns()
+            # Quote each username once, not once per platform
+            quoted = {username: quote_plus(username) for username in usernames}
+            with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as executor:
+                futures = {
+                    executor.submit(self._check_platform_cached, quoted[username],
+                                    platform_name): (username, platform_name)
+                    for username, platform_name, _ in tasks
                 }
-                
-                results["platforms"][platform_name].append(profile_info)
-                
-                if found:
-                    results["summary"]["found_profiles"] += 1
-                else:
-                    results["summary"]["not_found"] += 1
-        
+                outcomes = {futures[f]: f.result() for f in as_completed(futures)}
+
+        # One timestamp per scan; the checks above all ran in this burst
+        checked_at = self._get_timestamp()
+        for platform_name in self.platforms:
+            results["platforms"][platform_name] = []
+
+        for username, platform_name, platform_config in tasks:
+            found = outcomes[(username, platform_name)]
+
+            profile_info = {
+                "username": username,
+                "url": self._url_builders[platform_name](username),
+                "found": found,
+                "checked_at": checked_at
+            }
+
+            results["platforms"][platform_name].append(profile_info)
+
+            if found:
+                results["summary"]["found_profiles"] += 1
+            else:
+                results["summary"]["not_found"] += 1
+
         return results
     
     def _extract_usernames(self, target: Dict[str, str]) -> List[str]:
         """Extract usernames from target data"""
-        usernames = []
-        
+        # A set from the start: candidates dedupe as they are added
+        usernames = set()
+
         # Direct username
         if target.get("username"):
-            usernames.append(target["username"])
-        
+            usernames.add(target["username"])
+
         # Extract from email
         if target.get("email"):
-            email_username = target["email"].split("@")[0]
-            usernames.append(email_username)
-        
-        # Extract from full name (create potential usernames)
+            match = _EMAIL_LOCAL_RE.match(target["email"])
+            if match:
+                usernames.add(match.group(1))
+
+        # Extract from full name (create potential usernames);
+        # tokenizing on letter runs also splits hyphenated names
         if target.get("full_name"):
-            name_parts = target["full_name"].split()
+            name_parts = _NAME_TOKEN_RE.findall(target["full_name"])
             if len(name_parts) >= 2:
                 # Common username patterns
-                usernames.extend([
+                usernames.update([
                     f"{name_parts[0].lower()}{name_parts[1].lower()}",
                     f"{name_parts[0].lower()}.{name_parts[1].lower()}",
                     f"{name_parts[0][0].lower()}{name_parts[1].lower()}",
                     f"{name_parts[0].lower()}_{name_parts[1].lower()}"
                 ])
-        
-        # Remove duplicates and empty strings
-        return list(set([u for u in usernames if u.strip()]))
+
+        return [u for u in usernames if u.strip()]
     
-    def _check_platform(self, username: str, platform_config: Dict[str, Any]) -> bool:
-        """Check if username exists on a specific platform"""
+    def _prewarm_dns(self) -> None:
+        """Resolve every platform hostname once, in parallel
+
+        On a cold resolver cache each distinct host would otherwise pay
+        its DNS round trip serially in front of the first HTTP request;
+        warming them together costs one RTT total.
+        """
+        if self._dns_prewarmed:
+            return
+        self._dns_prewarmed = True
+
+        hosts = {
+            urlsplit(platform_config["url"].split("{")[0]).hostname
+            for platform_config in self.platforms.values()
+        }
+        hosts.discard(None)
+        if not hosts:
+            return
+
+        def resolve(host):
+            try:
+                socket.getaddrinfo(host, 443)
+            except OSError:
+                pass
+
+        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
+            executor.map(resolve, hosts)
+
+    def _check_platform_cached(self, quoted_username: str, platform_name: str) -> bool:
+        """Check a platform through the TTL cache
+
+        Keys hash the username so the store never holds it in the clear.
+        Expired entries still contribute their ETag/Last-Modified
+        validators, so the refresh can be a conditional request the
+        server may answer 304 with no body. Disabled entirely via the
+        no_cache config key (--no-cache).
+        """
+        if not self._cache_enabled:
+            return self._check_platform(quoted_username, platform_name)
+
+        digest = hashlib.sha1(quoted_username.lower().encode()).hexdigest()
+        key = f"{platform_name}:{digest}"
+        now = time.time()
+
+        hit = self._memory_cache.get(key)
+        if hit and now - hit[0] < _CHECK_CACHE_TTL:
+            return hit[1]
+
+        with self._cache_lock:
+            try:
+                with shelve.open(_CACHE_PATH) as db:
+                    hit = db.get(key)
+            except OSError:
+                hit = None
+        if hit and now - hit[0] < _CHECK_CACHE_TTL:
+            self._memory_cache[key] = hit
+            return hit[1]
+
+        conditional = None
+        if hit and len(hit) >= 4:
+            headers = {}
+            if hit[2]:
+                headers["If-None-Match"] = hit[2]
+            if hit[3]:
+                headers["If-Modified-Since"] = hit[3]
+            conditional = headers or None
+
+        found = self._check_platform(quoted_username, platform_name, conditional)
+        etag, last_modified = self._response_validators.pop(
+            (platform_name, quoted_username), (None, None))
+
+        entry = (now, found, etag, last_modified)
+        self._memory_cache[key] = entry
+        with self._cache_lock:
+            try:
+                os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+                with shelve.open(_CACHE_PATH) as db:
+                    db[key] = entry
+            except OSError:
+                pass
+
+        return found
+
+    def _check_platform(self, quoted_username: str, platform_name: str,
+                        conditional_headers: Optional[Dict[str, str]] = None) -> bool:
+        """Check if a (pre-quoted) username exists on a specific platform
+
+        Only the status code is inspected, so a HEAD request avoids
+        downloading profile HTML. Platforms can opt out with a per-config
+        "method": "GET"; either way a 1-byte ranged GET keeps the body off
+        the wire when HEAD is rejected. With validators from a prior scan
+        the request is conditional, and 304 Not Modified counts as the
+        profile still existing.
+        """
         try:
-            url = platform_config["url"].format(quote_plus(username))
-            response = self.http_client.get(url)
-            
+            platform_config = self.platforms[platform_name]
+            url = self._url_builders[platform_name](quoted_username)
+            extra = conditional_headers or {}
+
+            with self._host_sems[platform_name]:
+                if platform_config.get("method", "HEAD") == "HEAD":
+                    response = self.http_client.head(url, headers=extra or None,
+                                                     allow_redirects=True)
+                    if response.status_code in (405, 501):
+                        response = self.http_client.get(url, headers={"Range": "bytes=0-0", **extra})
+                else:
+                    response = self.http_client.get(url, headers={"Range": "bytes=0-0", **extra})
+
+            if response.status_code == 304:
+                return True
+
+            if response.status_code in (200, 206):
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    self._response_validators[(platform_name, quoted_username)] = (
+                        etag, last_modified)
+
             if platform_config["check_method"] == "status_code":
-                return response.status_code in platform_config["success_codes"]
-            
+                # A ranged GET answers 206 where a full GET would answer 200
+                status = 200 if response.status_code == 206 else response.status_code
+                return status in self._success_sets[platform_name]
+
             return False
-            
+
         except Exception as e:
             # Log error but don't fail the entire scan
             return False
     
     def _simulate_social_check(self, username: str, platform: str) -> bool:
         """Simulate social media check for test mode"""
-        # Simulate some platforms being found
-        test_found = ["twitter", "github", "linkedin"]
-        return platform in test_found and len(username) > 3
+        return platform in _TEST_FOUND_PLATFORMS and len(username) > 3
     
     def _get_timestamp(self) -> str:
         """Get current timestamp"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def get_description(self) -> str:
@@ -13,8 +13,8 @@ from utils.config import create_default_config
 
 def check_python_version():
     """Check if Python version is compatible"""
-    if sys.version_info < (3, 8):
-        print("Error: Python 3.8 or higher is required.")
+    if sys.version_info < (3, 10):
+        print("Error: Python 3.10 or higher is required.")
         print(f"Current version: {sys.version}")
         sys.exit(1)
     print(f"✓ Python version: {sys.version.split()[0]}")
@@ -63,18 +63,20 @@ example.com
 
 
 def test_installation():
-    """Test the installation"""
+    """Test the installation
+
+    Importing the CLI and building its parser exercises the same import
+    chain `python main.py --help` would, without paying a second
+    interpreter startup.
+    """
     print("Testing installation...")
     try:
-        result = subprocess.run([sys.executable, "main.py", "--help"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✓ Installation test passed")
-        else:
-            print("✗ Installation test failed")
-            print(result.stderr)
+        import main as main_module
+        main_module.create_parser()
+        print("✓ Installation test passed")
     except Exception as e:
-        print(f"Warning: Could not test installation: {e}")
+        print("✗ Installation test failed")
+        print(e)
 
 
 def main():
@@ -1,20 +1,59 @@
+import copy
+import sys
+import time
 import pytest
 import json
 from pathlib import Path
 from unittest.mock import MagicMock
 
-@pytest.fixture
-def mock_config():
-    """Provide mock configuration for tests"""
-    return {
-        "haveibeenpwned_api_key": "test_key",
-        "dehashed_api_key": "test_key",
-        "veriphone_api_key": "test_key",
-        "whoisxmlapi_key": "test_key",
-        "tineye_api_key": "test_key",
-        "peoplefinder_api_key": "test_key",
-        "courtlistener_api_key": "test_key"
+# Fixture templates built once at import; the per-test fixtures hand out
+# cheap copies instead of rebuilding the same structures hundreds of times
+_MOCK_CONFIG_TEMPLATE = {
+    "haveibeenpwned_api_key": "test_key",
+    "dehashed_api_key": "test_key",
+    "veriphone_api_key": "test_key",
+    "whoisxmlapi_key": "test_key",
+    "tineye_api_key": "test_key",
+    "peoplefinder_api_key": "test_key",
+    "courtlistener_api_key": "test_key"
+}
+
+_SAMPLE_SCAN_RESULTS_TEMPLATE = {
+    "target": {"username": "testuser"},
+    "scan_time": "2023-01-01T00:00:00",
+    "results": {
+        "social": {
+            "data": {
+                "platforms": {
+                    "twitter": [{"username": "testuser", "found": True}],
+                    "github": [{"username": "testuser", "found": True}]
+                },
+                "summary": {"found_profiles": 2}
+            },
+            "status": "completed",
+            "scan_time": 1.0
+        }
     }
+}
+
+@pytest.fixture(scope="class")
+def mock_config():
+    """Provide mock configuration for tests
+
+    Class-scoped so class-scoped scanner fixtures can depend on it; each
+    test class still gets its own copy, and scanners never mutate it.
+    """
+    return dict(_MOCK_CONFIG_TEMPLATE)
+
+@pytest.fixture(scope="session")
+def anonymizer():
+    """One Anonymizer for the whole session
+
+    It holds no mutable state, so every test can share the same instance
+    and its precompiled patterns.
+    """
+    from utils.anonymizer import Anonymizer
+    return Anonymizer()
 
 @pytest.fixture
 def sample_target():
@@ -35,23 +74,58 @@ def mock_http_response():
     response.json.return_value = {"success": True}
     return response
 
-@pytest.fixture
+@pytest.fixture(scope="class")
 def sample_scan_results():
-    """Provide sample scan results"""
-    return {
-        "target": {"username": "testuser"},
-        "scan_time": "2023-01-01T00:00:00",
-        "results": {
-            "social": {
-                "data": {
-                    "platforms": {
-                        "twitter": [{"username": "testuser", "found": True}],
-                        "github": [{"username": "testuser", "found": True}]
-                    },
-                    "summary": {"found_profiles": 2}
-                },
-                "status": "completed",
-                "scan_time": 1.0
-            }
-        }
-    } 
\ No newline at end of file
+    """Provide sample scan results
+
+    Deep-copied per class so tests can't leak mutations across classes;
+    the consumers (reporter, profile manager) never mutate their input.
+    """
+    return copy.deepcopy(_SAMPLE_SCAN_RESULTS_TEMPLATE)
+
+# Module -> cache-path constant, mirroring each module's cache_path call
+_CACHE_CONSTANTS = {
+    "modules.breach_check": ("_CACHE_PATH", "breach"),
+    "modules.geolocation": ("_DISK_CACHE_PATH", "geo"),
+    "modules.public_records": ("_CACHE_PATH", "public_records"),
+    "modules.social_media": ("_CACHE_PATH", "social"),
+    "utils.http_client": ("_HTTP_CACHE_PATH", "http_cache"),
+}
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path, monkeypatch):
+    """Point every persistent scanner cache at a per-test directory
+
+    The shelve caches otherwise write into the real user cache dir and
+    serve one run's 24h entries to the next, bypassing the tests' mocks.
+    XDG_CACHE_HOME covers modules imported after this fixture runs; the
+    constants of already-imported modules are repointed directly.
+    """
+    from utils.cache import cache_path
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    for module_name, (attr, name) in _CACHE_CONSTANTS.items():
+        module = sys.modules.get(module_name)
+        if module is not None:
+            monkeypatch.setattr(module, attr, cache_path(name))
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Turn real sleeps into no-ops during tests
+
+    The scanners don't sleep themselves, but urllib3's retry backoff
+    does, and the retry-path tests would otherwise wait it out.
+    """
+    monkeypatch.setattr(time, "sleep", lambda *_: None)
+
+@pytest.fixture(autouse=True)
+def reset_scanner_cache():
+    """Keep in-process CLI invocations hermetic across tests
+
+    Only touches main if some test actually imported it; unit-test runs
+    shouldn't pay for the CLI's import chain just to clear its cache.
+    """
+    yield
+    main = sys.modules.get("main")
+    if main is not None:
+        main._SCANNER_CACHE.clear()
@@ -1,29 +1,32 @@
 import pytest
-from unittest.mock import Mock, patch
 from modules.social_media import SocialMediaScanner
 
+@pytest.fixture(scope="class")
+def scanner(mock_config):
+    """One real-mode scanner shared by the extraction tests"""
+    return SocialMediaScanner(mock_config)
+
+@pytest.fixture(scope="class")
+def tm_scanner(mock_config):
+    """Test-mode scanner shared by the simulation-only tests"""
+    return SocialMediaScanner(mock_config, test_mode=True)
+
 class TestSocialMediaScanner:
-    def test_extract_usernames(self, mock_config):
+    @pytest.mark.parametrize("target,expected", [
+        ({"username": "johndoe"}, "johndoe"),
+        ({"email": "john.doe@example.com"}, "john.doe"),
+        ({"full_name": "John Doe"}, "johndoe"),
+        ({"full_name": "John Doe"}, "john.doe"),
+    ])
+    def test_extract_usernames(self, scanner, target, expected):
         """Test username extraction from target data"""
-        scanner = SocialMediaScanner(mock_config)
-        
-        # Test direct username
-        usernames = scanner._extract_usernames({"username": "johndoe"})
-        assert "johndoe" in usernames
-        
-        # Test email extraction
-        usernames = scanner._extract_usernames({"email": "john.doe@example.com"})
-        assert "john.doe" in usernames
-        
-        # Test full name extraction
-        usernames = scanner._extract_usernames({"full_name": "John Doe"})
-        assert "johndoe" in usernames
-        assert "john.doe" in usernames
+        assert expected in scanner._extract_usernames(target)
 
-    @patch('modules.social_media.SocialMediaScanner._check_platform')
-    def test_scan_with_mocked_platform_check(self, mock_check, mock_config):
+    def test_scan_with_mocked_platform_check(self, monkeypatch, mock_config):
         """Test social media scan with mocked platform checks"""
-        mock_check.return_value = True
+        def fake_check_platform(self, *args, **kwargs):
+            return True
+        monkeypatch.setattr(SocialMediaScanner, "_check_platform", fake_check_platform)
         
         scanner = SocialMediaScanner(mock_config)
         results = scanner.scan({"username": "testuser"})
@@ -31,65 +34,52 @@ class TestSocialMediaScanner:
         assert results["summary"]["found_profiles"] > 0
         assert "platforms" in results
 
-    def test_test_mode_simulation(self, mock_config):
+    def test_test_mode_simulation(self, tm_scanner):
         """Test that test mode properly simulates results"""
-        scanner = SocialMediaScanner(mock_config, test_mode=True)
-        results = scanner.scan({"username": "testuser"})
+        results = tm_scanner.scan({"username": "testuser"})
         
         assert results["summary"]["found_profiles"] == 3
         assert results["platforms"]["twitter"][0]["found"] is True
         assert results["platforms"]["github"][0]["found"] is True
 
-    def test_platform_check_methods(self, mock_config):
+    def test_platform_check_methods(self, tm_scanner):
         """Test individual platform check methods"""
-        scanner = SocialMediaScanner(mock_config, test_mode=True)
-        
-        # Test each platform check method exists
-        assert hasattr(scanner, '_check_twitter')
-        assert hasattr(scanner, '_check_linkedin')
-        assert hasattr(scanner, '_check_github')
-        assert hasattr(scanner, '_check_instagram')
+        # Every platform check method must exist; one dir() snapshot
+        # answers for all of them
+        required = {"_check_twitter", "_check_linkedin",
+                    "_check_github", "_check_instagram"}
+        assert required.issubset(dir(tm_scanner))
 
-    def test_nsfw_flag_handling(self, mock_config):
+    def test_nsfw_flag_handling(self, tm_scanner):
         """Test NSFW flag handling"""
-        scanner = SocialMediaScanner(mock_config, test_mode=True)
-        
         # Test without NSFW flag
-        results = scanner.scan({"username": "testuser"}, nsfw=False)
+        results = tm_scanner.scan({"username": "testuser"}, nsfw=False)
         platforms = results["platforms"].keys()
         assert "onlyfans" not in platforms
         
         # Test with NSFW flag
-        results = scanner.scan({"username": "testuser"}, nsfw=True)
+        results = tm_scanner.scan({"username": "testuser"}, nsfw=True)
         platforms = results["platforms"].keys()
         # In test mode, should include NSFW platforms
 
-    def test_empty_target_handling(self, mock_config):
-        """Test handling of empty target data"""
-        scanner = SocialMediaScanner(mock_config, test_mode=True)
-        
-        results = scanner.scan({})
-        assert results["summary"]["found_profiles"] == 0
-        assert "platforms" in results
+    @pytest.mark.parametrize("target,found", [
+        ({}, False),
+        ({"username": "testuser", "email": "john.doe@example.com",
+          "full_name": "John Doe"}, True),
+    ])
+    def test_scan_summary(self, tm_scanner, target, found):
+        """Test-mode scans report profiles consistent with the target"""
+        results = tm_scanner.scan(target)
 
-    def test_multiple_usernames(self, mock_config):
-        """Test handling of multiple usernames"""
-        scanner = SocialMediaScanner(mock_config, test_mode=True)
-        
-        # Target with multiple username sources
-        target = {
-            "username": "testuser",
-            "email": "john.doe@example.com",
-            "full_name": "John Doe"
-        }
-        
-        results = scanner.scan(target)
-        assert results["summary"]["found_profiles"] > 0
+        assert "platforms" in results
+        if found:
+            assert results["summary"]["found_profiles"] > 0
+        else:
+            assert results["summary"]["found_profiles"] == 0
 
-    def test_scan_timing(self, mock_config):
+    def test_scan_timing(self, tm_scanner):
         """Test scan timing calculation"""
-        scanner = SocialMediaScanner(mock_config, test_mode=True)
-        results = scanner.scan({"username": "testuser"})
+        results = tm_scanner.scan({"username": "testuser"})
         
         assert "scan_time" in results
         assert isinstance(results["scan_time"], (int, float)) 
\ No newline at end of file
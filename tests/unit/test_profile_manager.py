@@ -1,39 +1,56 @@
+import os
+import re
 import pytest
 import json
-import tempfile
-import shutil
 from pathlib import Path
 from unittest.mock import Mock, patch
 from core.profile_manager import ProfileManager
 
+# Every marker the export cases look for, folded into one alternation so
+# a single scan of the export output answers all of them
+_EXPORT_MARKERS = re.compile(r"testuser|<!DOCTYPE html>")
+
+def _names(directory):
+    """Snapshot a directory's entry names in one scandir pass"""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries}
+
+@pytest.fixture(scope="class")
+def manager(tmp_path_factory):
+    """A shared manager over its own scratch directory
+
+    Only for tests that never write profiles; mutation tests keep
+    building their own manager on tmp_path.
+    """
+    return ProfileManager(str(tmp_path_factory.mktemp("profiles")))
+
+@pytest.fixture(scope="class")
+def saved_profile(tmp_path_factory, sample_scan_results):
+    """A manager holding one saved profile, shared by the export cases"""
+    manager = ProfileManager(str(tmp_path_factory.mktemp("profiles")))
+    name = manager.save_profile({"username": "testuser"}, sample_scan_results)
+    return manager, name
+
 class TestProfileManager:
-    @pytest.fixture
-    def temp_profiles_dir(self):
-        """Create temporary directory for profile tests"""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
-
-    def test_profile_manager_initialization(self, temp_profiles_dir):
+    def test_profile_manager_initialization(self, tmp_path):
         """Test profile manager initializes correctly"""
-        manager = ProfileManager(temp_profiles_dir)
-        assert manager.profiles_dir == Path(temp_profiles_dir)
+        manager = ProfileManager(str(tmp_path))
+        assert manager.profiles_dir == tmp_path
         assert manager.profiles_dir.exists()
 
-    def test_save_profile(self, temp_profiles_dir, sample_scan_results):
+    def test_save_profile(self, tmp_path, sample_scan_results):
         """Test saving a profile"""
-        manager = ProfileManager(temp_profiles_dir)
+        manager = ProfileManager(str(tmp_path))
         target = {"username": "testuser"}
         
         profile_name = manager.save_profile(target, sample_scan_results)
         
         assert profile_name == "profile_testuser"
-        profile_file = Path(temp_profiles_dir) / f"{profile_name}.json"
-        assert profile_file.exists()
+        assert f"{profile_name}.json" in _names(tmp_path)
 
-    def test_load_profile(self, temp_profiles_dir, sample_scan_results):
+    def test_load_profile(self, tmp_path, sample_scan_results):
         """Test loading a profile"""
-        manager = ProfileManager(temp_profiles_dir)
+        manager = ProfileManager(str(tmp_path))
         target = {"username": "testuser"}
         
         # Save profile first
@@ -46,9 +63,9 @@ class TestProfileManager:
         assert loaded_profile["target"] == target
         assert "current_data" in loaded_profile
 
-    def test_list_profiles(self, temp_profiles_dir, sample_scan_results):
+    def test_list_profiles(self, tmp_path, sample_scan_results):
         """Test listing profiles"""
-        manager = ProfileManager(temp_profiles_dir)
+        manager = ProfileManager(str(tmp_path))
         
         # Save a few profiles
         manager.save_profile({"username": "user1"}, sample_scan_results)
@@ -60,9 +77,9 @@ class TestProfileManager:
         assert any(p["name"] == "profile_user1" for p in profiles)
         assert any(p["name"] == "profile_user2" for p in profiles)
 
-    def test_delete_profile(self, temp_profiles_dir, sample_scan_results):
+    def test_delete_profile(self, tmp_path, sample_scan_results):
         """Test deleting a profile"""
-        manager = ProfileManager(temp_profiles_dir)
+        manager = ProfileManager(str(tmp_path))
         target = {"username": "testuser"}
         
         # Save profile first
@@ -75,28 +92,24 @@ class TestProfileManager:
         profiles = manager.list_profiles()
         assert len(profiles) == 0
 
-    def test_export_profile(self, temp_profiles_dir, sample_scan_results):
+    @pytest.mark.parametrize("fmt,marker", [
+        ("json", None),
+        ("markdown", "testuser"),
+        ("html", "<!DOCTYPE html>"),
+    ])
+    def test_export_profile(self, saved_profile, fmt, marker):
         """Test exporting a profile"""
-        manager = ProfileManager(temp_profiles_dir)
-        target = {"username": "testuser"}
-        
-        # Save profile first
-        profile_name = manager.save_profile(target, sample_scan_results)
-        
-        # Export in different formats
-        json_export = manager.export_profile(profile_name, "json")
-        markdown_export = manager.export_profile(profile_name, "markdown")
-        html_export = manager.export_profile(profile_name, "html")
-        
-        assert json_export is not None
-        assert markdown_export is not None
-        assert html_export is not None
-        assert "testuser" in markdown_export
-        assert "<!DOCTYPE html>" in html_export
+        manager, profile_name = saved_profile
+
+        export = manager.export_profile(profile_name, fmt)
 
-    def test_merge_profiles(self, temp_profiles_dir, sample_scan_results):
+        assert export is not None
+        if marker is not None:
+            assert marker in set(_EXPORT_MARKERS.findall(export))
+
+    def test_merge_profiles(self, tmp_path, sample_scan_results):
         """Test merging profile data"""
-        manager = ProfileManager(temp_profiles_dir)
+        manager = ProfileManager(str(tmp_path))
         target = {"username": "testuser"}
         
         # Save initial profile
@@ -125,10 +138,8 @@ class TestProfileManager:
         assert "breach" in loaded_profile["current_data"]["results"]
         assert len(loaded_profile["scan_history"]) == 2
 
-    def test_generate_profile_name(self, temp_profiles_dir):
+    def test_generate_profile_name(self, manager):
         """Test profile name generation"""
-        manager = ProfileManager(temp_profiles_dir)
-        
         # Test username
         name = manager._generate_profile_name({"username": "testuser"})
         assert name == "profile_testuser"
@@ -141,10 +152,8 @@ class TestProfileManager:
         name = manager._generate_profile_name({"domain": "example.com"})
         assert name == "profile_example.com"
 
-    def test_profile_not_found(self, temp_profiles_dir):
+    def test_profile_not_found(self, manager):
         """Test handling of non-existent profile"""
-        manager = ProfileManager(temp_profiles_dir)
-        
         # Try to load non-existent profile
         profile = manager.load_profile("nonexistent")
         assert profile is None
@@ -1,58 +1,53 @@
 import pytest
-import json
-from unittest.mock import Mock, patch
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 from core.reporter import ReportGenerator
 
+@pytest.fixture(scope="class")
+def reporter():
+    """One stateless generator shared by the whole class"""
+    return ReportGenerator()
+
+@pytest.fixture(scope="class")
+def anon_report(reporter, sample_scan_results):
+    """Anonymized JSON report generated once per class
+
+    Generation dominates the anonymization tests; any number of
+    assertions can share this string.
+    """
+    return reporter.generate_report([sample_scan_results],
+                                    format_type="json", anonymize=True)
+
 class TestReportGenerator:
-    def test_reporter_initialization(self):
+    def test_reporter_initialization(self, reporter):
         """Test reporter initializes correctly"""
-        reporter = ReportGenerator()
         assert reporter is not None
 
-    def test_generate_json_report(self, sample_scan_results):
-        """Test JSON report generation"""
-        reporter = ReportGenerator()
-        report = reporter.generate_report([sample_scan_results], format_type="json")
-        
-        # Should return JSON string
-        assert isinstance(report, str)
-        data = json.loads(report)
-        assert "report_metadata" in data
-        assert "results" in data
+    @pytest.mark.parametrize("fmt,markers", [
+        ("json", ('"report_metadata"', '"results"')),
+        ("markdown", ("# OSINT Report", "testuser")),
+        ("html", ("<!DOCTYPE html>", "testuser")),
+    ])
+    def test_generate_report(self, reporter, sample_scan_results, fmt, markers):
+        """Test report generation across output formats"""
+        report = reporter.generate_report([sample_scan_results], format_type=fmt)
 
-    def test_generate_markdown_report(self, sample_scan_results):
-        """Test Markdown report generation"""
-        reporter = ReportGenerator()
-        report = reporter.generate_report([sample_scan_results], format_type="markdown")
-        
-        # Should return markdown string
-        assert isinstance(report, str)
-        assert "# OSINT Report" in report
-        assert "testuser" in report
-
-    def test_generate_html_report(self, sample_scan_results):
-        """Test HTML report generation"""
-        reporter = ReportGenerator()
-        report = reporter.generate_report([sample_scan_results], format_type="html")
-        
-        # Should return HTML string
         assert isinstance(report, str)
-        assert "<!DOCTYPE html>" in report
-        assert "testuser" in report
+        for marker in markers:
+            assert marker in report
 
-    def test_anonymize_report(self, sample_scan_results):
+    def test_anonymize_report(self, anon_report):
         """Test report anonymization"""
-        reporter = ReportGenerator()
-        report = reporter.generate_report([sample_scan_results], format_type="json", anonymize=True)
-        
-        data = json.loads(report)
-        # Check that sensitive data is anonymized
-        assert "testuser" not in str(data)
+        # Check the raw JSON string; round-tripping through json.loads and
+        # str(dict) proves nothing the substring check doesn't
+        assert "testuser" not in anon_report
 
-    def test_multiple_targets_report(self, sample_scan_results):
+    def test_multiple_targets_report(self, reporter, sample_scan_results):
         """Test report generation with multiple targets"""
-        reporter = ReportGenerator()
-        
         # Create multiple scan results
         scan_results = [
             sample_scan_results,
@@ -64,22 +59,19 @@ class TestReportGenerator:
         ]
         
         report = reporter.generate_report(scan_results, format_type="json")
-        data = json.loads(report)
+        data = _json.loads(report)
         
         assert len(data["results"]) == 2
 
-    def test_invalid_format_type(self, sample_scan_results):
+    def test_invalid_format_type(self, reporter, sample_scan_results):
         """Test handling of invalid format type"""
-        reporter = ReportGenerator()
-        
         with pytest.raises(ValueError):
             reporter.generate_report([sample_scan_results], format_type="invalid")
 
-    def test_empty_results(self):
+    def test_empty_results(self, reporter):
         """Test handling of empty results"""
-        reporter = ReportGenerator()
         report = reporter.generate_report([], format_type="json")
         
-        data = json.loads(report)
+        data = _json.loads(report)
         assert "report_metadata" in data
         assert len(data["results"]) == 0 
\ No newline at end of file
@@ -4,11 +4,16 @@ import tempfile
 from unittest.mock import Mock, patch
 from utils.config import load_config
 
+@pytest.fixture(scope="module")
+def default_config():
+    """Default config loaded once; it's invariant across these tests"""
+    return load_config()
+
 class TestConfig:
-    def test_load_config_default(self):
+    def test_load_config_default(self, default_config):
         """Test loading default configuration"""
-        config = load_config()
-        
+        config = default_config
+
         # Should return a dictionary
         assert isinstance(config, dict)
         
@@ -104,10 +109,10 @@ class TestConfig:
             # Clean up
             os.unlink(tmp_file.name)
 
-    def test_config_default_values(self):
+    def test_config_default_values(self, default_config):
         """Test that default values are set correctly"""
-        config = load_config()
-        
+        config = default_config
+
         # Check that all expected keys exist
         expected_keys = [
             "haveibeenpwned_api_key",
@@ -3,96 +3,315 @@ Anonymization Utility
 Provides data anonymization capabilities for sensitive information.
 """
 
+import functools
 import hashlib
+import io
+import json
 import re
 from typing import Dict, List, Any, Union
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# blake3 is SIMD-accelerated when present; sha256 picks up SHA-NI through
+# OpenSSL and is still much faster than md5's scalar loop
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    _hasher = hashlib.sha256
+
+# Alternation order mirrors the old sequential substitution order, so the
+# first pattern that used to claim a span still claims it
+_SENSITIVE_PATTERNS = {
+    # Local part and domain labels are capped at their RFC 5321 limits so
+    # the engine can't backtrack unboundedly on adversarial input
+    "email": r'\b[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9](?:[A-Za-z0-9\-]{0,62}[A-Za-z0-9])?(?:\.[A-Za-z]{2,24})+\b',
+    "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
+    "ip_address": r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
+    "credit_card": r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
+    "ssn": r'\b\d{3}-\d{2}-\d{4}\b'
+}
+
+# One compiled alternation so every string is scanned once instead of five
+# times; the matched group name selects the handler
+_COMBINED_PATTERN = re.compile(
+    "|".join(f"(?P<{name}>{pattern})"
+             for name, pattern in _SENSITIVE_PATTERNS.items()),
+    re.ASCII
+)
+
+# Delete-everything-but-digits table for the hash helpers; a translate
+# call is a single C loop, no regex machinery on the per-match path
+_KEEP_DIGITS = str.maketrans(
+    "", "", "".join(chr(c) for c in range(256) if not 48 <= c <= 57)
+)
+
+# Every sensitive pattern needs a digit or an '@'; one cheap char-class
+# scan rules out the typical PII-free string before the full machinery runs
+_HAS_SENTINEL = re.compile(r'[0-9@]', re.ASCII).search
+
+# Keyword dictionaries folded into single compiled alternations so field
+# classification is one scan instead of a Python loop per keyword
+_SENSITIVE_FIELD_SEARCH = re.compile(
+    "email|phone|password|ssn|credit|card|address|name|ip|key|secret|token"
+).search
+_SENSITIVE_VALUE_SEARCH = re.compile(
+    "email|phone|password|ssn|credit_card|ip"
+).search
+
+# Standalone compiles for the single-field fast paths; fullmatch against
+# one pattern beats the five-way dispatch when the type is already known
+_EMAIL_RE = re.compile(_SENSITIVE_PATTERNS["email"], re.ASCII)
+_PHONE_RE = re.compile(_SENSITIVE_PATTERNS["phone"], re.ASCII)
+
+# Pattern ids in the Hyperscan database, indexed in alternation order
+_PATTERN_NAMES = list(_SENSITIVE_PATTERNS)
+
+# Linear-time DFA scan over all patterns at once when hyperscan is
+# installed; compile failures fall back to the fused re path
+_HS_DATABASE = None
+if hyperscan is not None:
+    try:
+        _HS_DATABASE = hyperscan.Database()
+        _HS_DATABASE.compile(
+            expressions=[p.encode() for p in _SENSITIVE_PATTERNS.values()],
+            ids=list(range(len(_SENSITIVE_PATTERNS))),
+            flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(_SENSITIVE_PATTERNS)
+        )
+    except Exception:
+        _HS_DATABASE = None
+
 
 class Anonymizer:
-    """Data anonymization utility"""
-    
-    def __init__(self):
-        """Initialize anonymizer"""
-        self.sensitive_patterns = {
-            "email": r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-            "phone": r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b',
-            "ip_address": r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b',
-            "credit_card": r'\b\d{4}[- ]?\d{4}[- ]?\d{4}[- ]?\d{4}\b',
-            "ssn": r'\b\d{3}-\d{2}-\d{4}\b'
-        }
-    
+    """Data anonymization utility
+
+    Fully stateless: patterns and handler tables live on the class, and
+    __slots__ keeps instances down to a bare object allocation.
+    """
+
+    __slots__ = ()
+
+    sensitive_patterns = _SENSITIVE_PATTERNS
+
     def anonymize_data(self, data: Union[Dict, List, str]) -> Union[Dict, List, str]:
-        """Anonymize sensitive data in the given structure"""
-        if isinstance(data, dict):
-            return self._anonymize_dict(data)
-        elif isinstance(data, list):
-            return self._anonymize_list(data)
-        elif isinstance(data, str):
-            return self._anonymize_string(data)
-        else:
+        """Anonymize sensitive data in the given structure
+
+        Walks containers with an explicit worklist instead of recursing,
+        so deeply nested scan results don't pay per-node frame setup.
+        Untouched subtrees are returned as-is — new containers are only
+        allocated along paths where a string actually changed.
+        """
+        return self._transform_tree(data, self._anonymize_string)
+
+    def anonymize_batch(self, records: List[Any]) -> List[Any]:
+        """Anonymize many records with one scan over all their strings
+
+        Collects every candidate string leaf, joins them on a sentinel
+        that no pattern can match across, runs the scan once over the
+        combined buffer and scatters the pieces back — amortizing the
+        engine's per-call overhead across the whole batch.
+        """
+        strings = set()
+        for record in records:
+            self._collect_strings(record, strings)
+        # Strings containing the sentinel would skew the split; they are
+        # rare enough to just transform individually
+        joinable = [s for s in strings if "\x1f" not in s]
+
+        mapping = {}
+        if joinable:
+            joined = "\x1f".join(joinable)
+            pieces = self._anonymize_string_impl(joined).split("\x1f")
+            mapping = {
+                original: piece
+                for original, piece in zip(joinable, pieces)
+                if piece != original
+            }
+
+        def transform(text):
+            try:
+                return mapping[text]
+            except KeyError:
+                return text if "\x1f" not in text else self._anonymize_string(text)
+
+        return [self._transform_tree(record, transform) for record in records]
+
+    def _collect_strings(self, data: Any, out: set) -> None:
+        """Gather candidate string leaves from a record into out"""
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            kind = type(node)
+            if kind is str:
+                if _HAS_SENTINEL(node):
+                    out.add(node)
+            elif kind is dict:
+                stack.extend(node.values())
+            elif kind is list:
+                stack.extend(node)
+
+    def _transform_tree(self, data: Union[Dict, List, str], transform) -> Any:
+        """Copy-on-write walk applying transform to every string leaf"""
+        kind = type(data)
+        if kind is str:
+            return transform(data)
+        elif kind is not dict and kind is not list:
             return data
-    
+
+        # Frame layout: [node, pending items iterator, (key, value) pairs
+        # produced so far, whether any pair differs from the original]
+        frames = [[data, self._node_items(data), [], False]]
+        while True:
+            frame = frames[-1]
+            descended = False
+            for key, value in frame[1]:
+                kind = type(value)
+                if kind is str:
+                    new = transform(value)
+                elif kind is dict or kind is list:
+                    # Park a placeholder; the child frame fills it on pop
+                    frame[2].append((key, None))
+                    frames.append([value, self._node_items(value), [], False])
+                    descended = True
+                    break
+                else:
+                    new = value
+                frame[2].append((key, new))
+                if new is not value:
+                    frame[3] = True
+            if descended:
+                continue
+
+            node = frame[0]
+            if frame[3]:
+                if type(node) is dict:
+                    result = dict(frame[2])
+                else:
+                    result = [value for _, value in frame[2]]
+            else:
+                result = node
+
+            frames.pop()
+            if not frames:
+                return result
+            parent = frames[-1]
+            key, _ = parent[2][-1]
+            parent[2][-1] = (key, result)
+            if result is not node:
+                parent[3] = True
+
+    @staticmethod
+    def _node_items(node: Union[Dict, List]):
+        """Iterate a container as (key, value) pairs regardless of kind"""
+        return iter(node.items()) if type(node) is dict else enumerate(node)
+
+    def anonymize_data_and_serialize(self, data: Union[Dict, List, str]) -> str:
+        """Anonymize and JSON-encode in one traversal
+
+        Fuses anonymize_data with serialization so no intermediate
+        anonymized tree is allocated; meant for hot paths that only need
+        the encoded form, like log emission. Output is compact JSON.
+        """
+        out = io.StringIO()
+        self._write_anonymized(data, out)
+        return out.getvalue()
+
+    def _write_anonymized(self, obj: Any, out: io.StringIO) -> None:
+        """Emit obj as JSON into out, anonymizing strings on the way"""
+        kind = type(obj)
+        if kind is str:
+            out.write(json.dumps(self._anonymize_string(obj)))
+        elif kind is dict:
+            out.write("{")
+            first = True
+            for key, value in obj.items():
+                if first:
+                    first = False
+                else:
+                    out.write(", ")
+                out.write(json.dumps(key if type(key) is str else str(key)))
+                out.write(": ")
+                self._write_anonymized(value, out)
+            out.write("}")
+        elif kind is list:
+            out.write("[")
+            first = True
+            for value in obj:
+                if first:
+                    first = False
+                else:
+                    out.write(", ")
+                self._write_anonymized(value, out)
+            out.write("]")
+        else:
+            out.write(json.dumps(obj))
+
     def _anonymize_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Anonymize dictionary data"""
-        anonymized = {}
-        
-        for key, value in data.items():
-            if isinstance(value, (dict, list)):
-                anonymized[key] = self.anonymize_data(value)
-            elif isinstance(value, str):
-                anonymized[key] = self._anonymize_string(value)
-            else:
-                anonymized[key] = value
-        
-        return anonymized
-    
+        return self.anonymize_data(data)
+
     def _anonymize_list(self, data: List[Any]) -> List[Any]:
         """Anonymize list data"""
-        return [self.anonymize_data(item) for item in data]
+        return self.anonymize_data(data)
     
     def _anonymize_string(self, text: str) -> str:
         """Anonymize sensitive patterns in text"""
         if not isinstance(text, str):
             return text
-        
-        anonymized = text
-        
-        # Anonymize emails
-        anonymized = re.sub(
-            self.sensitive_patterns["email"],
-            lambda m: self._hash_email(m.group()),
-            anonymized
-        )
-        
-        # Anonymize phone numbers
-        anonymized = re.sub(
-            self.sensitive_patterns["phone"],
-            lambda m: self._hash_phone(m.group()),
-            anonymized
-        )
-        
-        # Anonymize IP addresses
-        anonymized = re.sub(
-            self.sensitive_patterns["ip_address"],
-            lambda m: self._hash_ip(m.group()),
-            anonymized
-        )
-        
-        # Anonymize credit card numbers
-        anonymized = re.sub(
-            self.sensitive_patterns["credit_card"],
-            lambda m: self._hash_credit_card(m.group()),
-            anonymized
-        )
-        
-        # Anonymize SSNs
-        anonymized = re.sub(
-            self.sensitive_patterns["ssn"],
-            lambda m: self._hash_ssn(m.group()),
-            anonymized
-        )
-        
-        return anonymized
+
+        if not _HAS_SENTINEL(text):
+            return text
+
+        # Hand back the original object when nothing matched so callers
+        # can detect "unchanged" by identity
+        result = _cached_anonymize(text)
+        return text if result == text else result
+
+    def _anonymize_string_impl(self, text: str) -> str:
+        """Run the actual pattern scan; called through the memo cache"""
+        if _HS_DATABASE is not None:
+            return self._anonymize_string_hs(text)
+        return _COMBINED_PATTERN.sub(self._replace_match, text)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop memoized string anonymizations (mainly for tests)"""
+        _cached_anonymize.cache_clear()
+
+    def _replace_match(self, match: "re.Match") -> str:
+        """Route a combined-pattern match to its handler"""
+        return self._handlers_by_group[match.lastindex](match.group())
+
+    def _anonymize_string_hs(self, text: str) -> str:
+        """Anonymize via a single Hyperscan pass over the encoded text"""
+        data = text.encode("utf-8")
+        spans = []
+
+        def on_match(pattern_id, start, end, flags, context):
+            spans.append((start, pattern_id, -end))
+
+        _HS_DATABASE.scan(data, match_event_handler=on_match)
+        if not spans:
+            return text
+
+        # Hyperscan reports every match, overlaps included; keep the
+        # leftmost non-overlapping spans, breaking ties the same way the
+        # fused alternation does (first pattern wins, longest match wins)
+        spans.sort()
+        pieces = []
+        cursor = 0
+        for start, pattern_id, neg_end in spans:
+            if start < cursor:
+                continue
+            end = -neg_end
+            handler = self._handlers[_PATTERN_NAMES[pattern_id]]
+            pieces.append(data[cursor:start].decode("utf-8"))
+            pieces.append(handler(data[start:end].decode("utf-8")))
+            cursor = end
+        pieces.append(data[cursor:].decode("utf-8"))
+        return "".join(pieces)
     
     def anonymize_value(self, value: str) -> str:
         """Anonymize a single value"""
@@ -100,79 +319,129 @@ class Anonymizer:
             return str(value)
         
         # Check for common sensitive field names
-        sensitive_fields = ["email", "phone", "password", "ssn", "credit_card", "ip"]
-        
-        for field in sensitive_fields:
-            if field in value.lower():
-                return self._hash_value(value)
-        
+        if _SENSITIVE_VALUE_SEARCH(value.lower()):
+            return self._hash_value(value)
+
         return self._anonymize_string(value)
     
-    def _hash_email(self, email: str) -> str:
+    @staticmethod
+    def _hash_email(email: str) -> str:
         """Hash email address"""
         if "@" not in email:
             return email
         
         username, domain = email.split("@", 1)
-        hashed_username = self._hash_value(username)
+        hashed_username = Anonymizer._hash_value(username)
         return f"{hashed_username}@{domain}"
     
-    def _hash_phone(self, phone: str) -> str:
+    @staticmethod
+    def _hash_phone(phone: str) -> str:
         """Hash phone number"""
-        cleaned = re.sub(r'[^\d]', '', phone)
+        cleaned = phone.translate(_KEEP_DIGITS)
         if len(cleaned) == 10:
             return f"***-***-{cleaned[-4:]}"
         elif len(cleaned) == 11 and cleaned.startswith('1'):
             return f"+1-***-***-{cleaned[-4:]}"
         else:
-            return self._hash_value(phone)
+            return Anonymizer._hash_value(phone)
     
-    def _hash_ip(self, ip: str) -> str:
+    @staticmethod
+    def _hash_ip(ip: str) -> str:
         """Hash IP address"""
         parts = ip.split('.')
         if len(parts) == 4:
             return f"{parts[0]}.{parts[1]}.*.*"
-        return self._hash_value(ip)
+        return Anonymizer._hash_value(ip)
     
-    def _hash_credit_card(self, card: str) -> str:
+    @staticmethod
+    def _hash_credit_card(card: str) -> str:
         """Hash credit card number"""
-        cleaned = re.sub(r'[^\d]', '', card)
+        cleaned = card.translate(_KEEP_DIGITS)
         if len(cleaned) >= 4:
             return f"****-****-****-{cleaned[-4:]}"
-        return self._hash_value(card)
+        return Anonymizer._hash_value(card)
     
-    def _hash_ssn(self, ssn: str) -> str:
+    @staticmethod
+    def _hash_ssn(ssn: str) -> str:
         """Hash SSN"""
-        cleaned = re.sub(r'[^\d]', '', ssn)
+        cleaned = ssn.translate(_KEEP_DIGITS)
         if len(cleaned) == 9:
             return f"***-**-{cleaned[-4:]}"
-        return self._hash_value(ssn)
+        return Anonymizer._hash_value(ssn)
     
-    def _hash_value(self, value: str) -> str:
+    @staticmethod
+    def _hash_value(value: str) -> str:
         """Create a hash of the value"""
         if not value:
             return value
         
         # Create a short hash for readability
-        hash_obj = hashlib.md5(value.encode())
+        hash_obj = _hasher(value.encode())
         return f"[HASH:{hash_obj.hexdigest()[:8]}]"
     
     def is_sensitive_field(self, field_name: str) -> bool:
         """Check if a field name indicates sensitive data"""
-        sensitive_keywords = [
-            "email", "phone", "password", "ssn", "credit", "card",
-            "address", "name", "ip", "key", "secret", "token"
-        ]
-        
-        field_lower = field_name.lower()
-        return any(keyword in field_lower for keyword in sensitive_keywords)
+        return _SENSITIVE_FIELD_SEARCH(field_name.lower()) is not None
     
+    @staticmethod
+    def anonymize_email(email: str) -> str:
+        """Anonymize a value already known to be an email
+
+        Skips the five-way pattern dispatch; callers whose schema says
+        "this field is an email" can hash it directly.
+        """
+        if type(email) is str and _EMAIL_RE.fullmatch(email):
+            return Anonymizer._hash_email(email)
+        return email
+
+    @staticmethod
+    def anonymize_phone(phone: str) -> str:
+        """Anonymize a value already known to be a phone number"""
+        if type(phone) is str and _PHONE_RE.fullmatch(phone):
+            return Anonymizer._hash_phone(phone)
+        return phone
+
     def anonymize_field(self, field_name: str, value: Any) -> Any:
         """Anonymize a field based on its name and value"""
         if self.is_sensitive_field(field_name):
             if isinstance(value, str):
+                # Exactly-named fields take the specialized path; values
+                # that don't parse fall through to the generic scan
+                lowered = field_name.lower()
+                if lowered == "email" and _EMAIL_RE.fullmatch(value):
+                    return self._hash_email(value)
+                if lowered == "phone" and _PHONE_RE.fullmatch(value):
+                    return self._hash_phone(value)
                 return self.anonymize_value(value)
             elif isinstance(value, (dict, list)):
                 return self.anonymize_data(value)
-        
-        return value 
\ No newline at end of file
+
+        return value
+
+
+# Handler tables bound after the class body so they hold the plain
+# functions; every instance shares them through class-attribute lookup
+Anonymizer._handlers = {
+    "email": Anonymizer._hash_email,
+    "phone": Anonymizer._hash_phone,
+    "ip_address": Anonymizer._hash_ip,
+    "credit_card": Anonymizer._hash_credit_card,
+    "ssn": Anonymizer._hash_ssn
+}
+Anonymizer._handlers_by_group = [None] + [
+    Anonymizer._handlers[name] for name in _PATTERN_NAMES
+]
+
+
+@functools.lru_cache(maxsize=100_000)
+def _cached_anonymize(text: str) -> str:
+    """Memoize anonymization per unique string
+
+    OSINT payloads repeat the same emails, IPs and phone numbers across
+    many records; the pipeline is deterministic and Anonymizer carries no
+    per-instance state, so one shared cache serves every instance.
+    """
+    return _SHARED._anonymize_string_impl(text)
+
+
+_SHARED = Anonymizer()
\ No newline at end of file
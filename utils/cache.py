@@ -0,0 +1,18 @@
+"""
+Cache Path Utility
+Resolves where the scanners keep their persistent caches.
+"""
+
+import os
+
+
+def cache_path(name: str) -> str:
+    """Return the path for a named persistent cache
+
+    Caches live under $XDG_CACHE_HOME/auto-osint, defaulting to
+    ~/.cache/auto-osint, so tests and sandboxed runs can relocate every
+    scanner cache with one environment variable.
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache")
+    return os.path.join(root, "auto-osint", name)
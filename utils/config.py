@@ -3,89 +3,194 @@ Configuration Utility
 Handles loading and managing application configuration.
 """
 
+import copy
+import functools
+import hashlib
 import os
 import json
-from typing import Dict, Any
+import time
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data: bytes) -> Any:
+    """Parse JSON, preferring orjson's native scanner when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Encode indented JSON bytes, preferring orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+# API key environment variables and the config keys they populate
+_ENV_MAPPINGS = {
+    "HIBP_API_KEY": "haveibeenpwned_api_key",
+    "DEHASHED_API_KEY": "dehashed_api_key",
+    "VERIPHONE_API_KEY": "veriphone_api_key",
+    "WHOISXMLAPI_KEY": "whoisxmlapi_key",
+    "TINEYE_API_KEY": "tineye_api_key",
+    "PEOPLEFINDER_API_KEY": "peoplefinder_api_key",
+    "COURTLISTENER_API_KEY": "courtlistener_api_key"
+}
+
+
+# How long a stat result stays trusted before the file is re-checked;
+# long-running scans otherwise pay a stat syscall per load_config call
+_STAT_TTL = 5.0
+_stat_cache: Dict[str, Tuple[float, Optional[Tuple]]] = {}
+
 
 def load_config(config_file: str = "config.json") -> Dict[str, Any]:
-    """Load configuration from file or environment variables"""
-    config = {}
-    
-    # Try to load from config file
+    """Load configuration from file or environment variables
+
+    Parsing is memoized on the file's path and mtime together with the
+    relevant environment values; the stat itself is reused for a few
+    seconds, so edits are picked up within _STAT_TTL of being written.
+    """
     config_path = Path(config_file)
-    if config_path.exists():
+    key = str(config_path)
+    now = time.monotonic()
+
+    hit = _stat_cache.get(key)
+    if hit is not None and now - hit[0] < _STAT_TTL:
+        fingerprint = hit[1]
+    else:
+        try:
+            stat = config_path.stat()
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprint = None
+        _stat_cache[key] = (now, fingerprint)
+
+    env = os.environ
+    env_fingerprint = tuple(env.get(var) for var in _ENV_MAPPINGS)
+    cached = _load_config_cached(str(config_path), fingerprint, env_fingerprint)
+    # Hand out a deep copy: a shallow one would alias nested sections
+    # (api_keys, settings, ...) to the cache entry, letting any caller
+    # mutation poison every later load_config in the process
+    return copy.deepcopy(cached)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_file: str, fingerprint: Optional[Tuple],
+                        env_fingerprint: Tuple) -> Dict[str, Any]:
+    """Parse the config file and env once per (path, stat, env) key"""
+    config = {}
+
+    # Try to load from config file; fingerprint is None when it's absent
+    if fingerprint is not None:
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(config_file, 'rb') as f:
+                config = _loads(f.read())
+        except (ValueError, IOError) as e:
             print(f"Warning: Could not load config file {config_file}: {e}")
-    
+
     # Override with environment variables
     config.update(_load_env_config())
-    
+
     return config
 
 
 def _load_env_config() -> Dict[str, Any]:
     """Load configuration from environment variables"""
+    env = os.environ
     env_config = {}
-    
-    # API keys
-    env_mappings = {
-        "HIBP_API_KEY": "haveibeenpwned_api_key",
-        "DEHASHED_API_KEY": "dehashed_api_key",
-        "VERIPHONE_API_KEY": "veriphone_api_key",
-        "WHOISXMLAPI_KEY": "whoisxmlapi_key",
-        "TINEYE_API_KEY": "tineye_api_key",
-        "PEOPLEFINDER_API_KEY": "peoplefinder_api_key",
-        "COURTLISTENER_API_KEY": "courtlistener_api_key"
-    }
-    
-    for env_var, config_key in env_mappings.items():
-        value = os.getenv(env_var)
+
+    for env_var, config_key in _ENV_MAPPINGS.items():
+        value = env.get(env_var)
         if value:
             env_config[config_key] = value
-    
+
     return env_config
 
 
+# Digest of the last bytes written per path, keyed on the file's stat
+# fingerprint so out-of-band edits invalidate it
+_save_hash_cache: Dict[str, Tuple[Tuple, bytes]] = {}
+
+
 def save_config(config: Dict[str, Any], config_file: str = "config.json") -> bool:
-    """Save configuration to file"""
+    """Save configuration to file
+
+    Skips the write when the serialized bytes match what is already on
+    disk, so periodic "save current state" calls don't churn the file's
+    mtime (and with it the load_config cache) for identical content.
+    """
+    path = Path(config_file)
+    new_bytes = _dumps(config)
+    new_hash = hashlib.blake2b(new_bytes, digest_size=16).digest()
     try:
-        with open(config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        try:
+            stat = path.stat()
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            fingerprint = None
+
+        if fingerprint is not None:
+            cached = _save_hash_cache.get(config_file)
+            if cached is not None and cached[0] == fingerprint:
+                old_hash = cached[1]
+            else:
+                old_hash = hashlib.blake2b(path.read_bytes(),
+                                           digest_size=16).digest()
+            if old_hash == new_hash:
+                _save_hash_cache[config_file] = (fingerprint, new_hash)
+                return True
+
+        path.write_bytes(new_bytes)
+        stat = path.stat()
+        _save_hash_cache[config_file] = ((stat.st_mtime_ns, stat.st_size),
+                                         new_hash)
         return True
     except IOError as e:
         print(f"Error saving config file {config_file}: {e}")
         return False
 
 
+# Keys every fully-configured installation is expected to carry; also
+# the skeleton of the default config template below
+_REQUIRED_KEYS = (
+    "haveibeenpwned_api_key",
+    "dehashed_api_key",
+    "veriphone_api_key",
+    "whoisxmlapi_key",
+    "tineye_api_key",
+    "peoplefinder_api_key",
+    "courtlistener_api_key"
+)
+
+
+# Default config template, built once at import; the proxy keeps casual
+# callers from mutating the shared copy
+_DEFAULT_CONFIG = MappingProxyType({
+    "api_keys": {key: "" for key in _REQUIRED_KEYS},
+    "settings": {
+        "default_timeout": 30,
+        "max_retries": 3,
+        "user_agent": "Auto-OSINT-Scanner/1.0"
+    },
+    "features": {
+        "enable_nsfw_search": False,
+        "enable_test_mode": False,
+        "enable_verbose_logging": False
+    }
+})
+
+
 def create_default_config(config_file: str = "config.json") -> Dict[str, Any]:
     """Create a default configuration file"""
-    default_config = {
-        "api_keys": {
-            "haveibeenpwned_api_key": "",
-            "dehashed_api_key": "",
-            "veriphone_api_key": "",
-            "whoisxmlapi_key": "",
-            "tineye_api_key": "",
-            "peoplefinder_api_key": "",
-            "courtlistener_api_key": ""
-        },
-        "settings": {
-            "default_timeout": 30,
-            "max_retries": 3,
-            "user_agent": "Auto-OSINT-Scanner/1.0"
-        },
-        "features": {
-            "enable_nsfw_search": False,
-            "enable_test_mode": False,
-            "enable_verbose_logging": False
-        }
-    }
-    
+    default_config = copy.deepcopy(dict(_DEFAULT_CONFIG))
+
     if save_config(default_config, config_file):
         print(f"Default configuration created: {config_file}")
         print("Please add your API keys to the configuration file.")
@@ -93,39 +198,39 @@ def create_default_config(config_file: str = "config.json") -> Dict[str, Any]:
     return default_config
 
 
+def _flatten_api_keys(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge top-level and nested api_keys entries into one lookup table
+
+    Top-level keys win, matching get_api_key's historical precedence.
+    """
+    nested = config.get("api_keys")
+    if not isinstance(nested, dict):
+        return config
+    return {**nested, **config}
+
+
 def get_api_key(config: Dict[str, Any], key_name: str) -> str:
     """Get API key from configuration"""
     # Try direct key first
     if key_name in config:
         return config[key_name]
-    
+
     # Try nested structure
     if "api_keys" in config and key_name in config["api_keys"]:
         return config["api_keys"][key_name]
-    
+
     return ""
 
 
 def validate_config(config: Dict[str, Any]) -> Dict[str, Any]:
     """Validate configuration and return missing keys"""
-    required_keys = [
-        "haveibeenpwned_api_key",
-        "dehashed_api_key",
-        "veriphone_api_key",
-        "whoisxmlapi_key",
-        "tineye_api_key",
-        "peoplefinder_api_key",
-        "courtlistener_api_key"
-    ]
-    
-    missing_keys = []
-    for key in required_keys:
-        if not get_api_key(config, key):
-            missing_keys.append(key)
-    
+    # Flatten once instead of re-probing both levels per key
+    flat = _flatten_api_keys(config)
+    missing_keys = [key for key in _REQUIRED_KEYS if not flat.get(key)]
+
     return {
         "valid": len(missing_keys) == 0,
         "missing_keys": missing_keys,
-        "total_keys": len(required_keys),
-        "available_keys": len(required_keys) - len(missing_keys)
-    } 
\ No newline at end of file
+        "total_keys": len(_REQUIRED_KEYS),
+        "available_keys": len(_REQUIRED_KEYS) - len(missing_keys)
+    }
\ No newline at end of file
@@ -3,90 +3,455 @@ HTTP Client Utility
 Provides a centralized HTTP client for making requests with proper error handling.
 """
 
-import requests
+import functools
+import hashlib
+import os
+import shelve
+import threading
 import time
-from typing import Dict, Any, Optional
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Any, List, Optional
+from utils.cache import cache_path
+
+if TYPE_CHECKING:
+    import requests
+
+# Two-tier GET cache shared with no one: process dict in front, shelve
+# file behind, same layout the scanner caches use
+_HTTP_CACHE_PATH = cache_path("http_cache")
+_HTTP_CACHE_TTL = 3600  # fresh window before a conditional revalidation
+
+# Filled in lazily so importing this module (which every scanner does for
+# safe_none) doesn't drag in the whole requests/urllib3 import chain
+_SAFE_NONE_ERRORS = None
+
+
+def _safe_none_errors():
+    """Resolve the failure modes a provider call can legitimately hit
+
+    Network errors (OSError covers socket.gaierror and friends; urllib3
+    for direct pool use), malformed JSON bodies (ValueError) and
+    responses missing expected keys (KeyError).
+    """
+    global _SAFE_NONE_ERRORS
+    if _SAFE_NONE_ERRORS is None:
+        import requests
+        import urllib3
+        _SAFE_NONE_ERRORS = (requests.RequestException,
+                             urllib3.exceptions.HTTPError,
+                             OSError, ValueError, KeyError)
+    return _SAFE_NONE_ERRORS
+
+
+def safe_none(func):
+    """Degrade provider-call failures to None instead of raising
+
+    Scanner lookups treat None as "no data"; wrapping them with this
+    decorator replaces the per-method try/except blocks while keeping
+    genuinely unexpected exceptions visible.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except _safe_none_errors():
+            return None
+    return wrapper
+
+
+class _FastResponse:
+    """Light wrapper giving urllib3 responses the surface scanners use"""
+
+    __slots__ = ("status_code", "headers", "content")
+
+    def __init__(self, raw):
+        self.status_code = raw.status
+        self.headers = raw.headers
+        self.content = raw.data
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+    def json(self) -> Any:
+        try:
+            import orjson
+            return orjson.loads(self.content)
+        except ImportError:
+            import json
+            return json.loads(self.content)
+
+
+class FastHTTPClient:
+    """Thin urllib3 client for simple GET/HEAD lookups
+
+    Skips requests' PreparedRequest construction and hook dispatch —
+    pure-Python overhead on every call — by talking to a PoolManager
+    directly. Responses come back wrapped with the status_code/headers/
+    content/json() surface callers already expect. Use HTTPClient for
+    anything needing requests' conveniences (POST bodies, cookies).
+    """
+
+    def __init__(self, timeout: int = 30, max_retries: int = 3):
+        """Initialize the pool lazily, like HTTPClient's session"""
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self._pool = None
+
+    @property
+    def pool(self):
+        """The urllib3 PoolManager, constructed on first use"""
+        if self._pool is None:
+            import urllib3
+            from urllib3.util.retry import Retry
+
+            self._pool = urllib3.PoolManager(
+                num_pools=32,
+                maxsize=32,
+                retries=Retry(
+                    total=self.max_retries,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+                    backoff_factor=0.25
+                ),
+                headers={"User-Agent": "Auto-OSINT-Scanner/1.0"},
+                timeout=urllib3.Timeout(total=self.timeout)
+            )
+        return self._pool
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None) -> _FastResponse:
+        """Make a GET request"""
+        return _FastResponse(
+            self.pool.request("GET", url, fields=params, headers=headers)
+        )
+
+    def head(self, url: str,
+             headers: Optional[Dict[str, str]] = None) -> _FastResponse:
+        """Make a HEAD request"""
+        return _FastResponse(
+            self.pool.request("HEAD", url, headers=headers)
+        )
+
+    def close(self):
+        """Release the pooled connections"""
+        if self._pool is not None:
+            self._pool.clear()
+
+
+class _TokenBucket:
+    """Token-bucket pacer for one host
+
+    Refills at `rate` tokens/second up to `capacity`. Pre-emptively
+    spacing requests is far cheaper than letting the server 429 us into
+    urllib3's multi-second retry backoff; when the bucket runs dry the
+    caller waits only the fraction of a second until the next token.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated", "lock")
+
+    def __init__(self, rate: float = 5.0, capacity: float = 10.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, sleeping briefly if none is available yet"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity,
+                              self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            # Negative balance = reserved ahead; wait our share outside
+            # the lock so other threads can book theirs
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_client(timeout: int = 30, max_retries: int = 3) -> "HTTPClient":
+    """Shared HTTPClient per (timeout, max_retries) configuration
+
+    Modules constructed without an injected client reuse one pooled
+    session process-wide instead of each building its own.
+    """
+    return HTTPClient(timeout=timeout, max_retries=max_retries)
+
+
+@functools.lru_cache(maxsize=None)
+def get_fast_client(timeout: int = 30, max_retries: int = 3) -> FastHTTPClient:
+    """Shared FastHTTPClient per (timeout, max_retries) configuration
+
+    The urllib3 pool counterpart of get_default_client, for scanners
+    whose hot loops are simple GET/HEAD lookups.
+    """
+    return FastHTTPClient(timeout=timeout, max_retries=max_retries)
 
 
 class HTTPClient:
-    """HTTP client with retry logic and proper error handling"""
-    
+    """HTTP client with retry logic and proper error handling
+
+    Each instance holds one pooled requests.Session, so every scanner that
+    creates an HTTPClient reuses keep-alive connections across its calls
+    instead of paying DNS + TCP + TLS setup per request. The session (and
+    the requests import itself) is built on first use, keeping client
+    construction free for invocations that never hit the network.
+    """
+
     def __init__(self, timeout: int = 30, max_retries: int = 3):
         """Initialize HTTP client"""
         self.timeout = timeout
-        self.session = requests.Session()
-        
-        # Configure retry strategy
+        self.max_retries = max_retries
+        self._session = None
+        self._response_cache = {}
+        self._cache_lock = threading.Lock()
+        self._buckets = {}
+        self._buckets_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        """The pooled session, constructed lazily on first access"""
+        if self._session is None:
+            self._session = self._build_session()
+        return self._session
+
+    def _build_session(self) -> "requests.Session":
+        """Create and configure the pooled session"""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+
+        # Retry only genuine server errors; 429s are avoided up front by
+        # the per-host pacer, and Retry-After is honored when sent
         retry_strategy = Retry(
-            total=max_retries,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"],
-            backoff_factor=1
+            total=self.max_retries,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=frozenset(["HEAD", "GET", "OPTIONS"]),
+            backoff_factor=0.25,
+            respect_retry_after_header=True
+        )
+
+        # Pool sizes match the scanner fan-out so threads hitting the same
+        # host reuse keep-alive connections instead of re-handshaking; the
+        # per-host cap is doubled because one client is now shared by
+        # several scanners fanning out at once
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=32,
+            pool_maxsize=64
         )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
         # Set default headers
-        self.session.headers.update({
+        session.headers.update({
             "User-Agent": "Auto-OSINT-Scanner/1.0"
         })
-    
-    def get(self, url: str, params: Optional[Dict[str, Any]] = None, 
-            headers: Optional[Dict[str, str]] = None) -> requests.Response:
-        """Make a GET request"""
+
+        return session
+
+    def _pace(self, url: str) -> None:
+        """Take a token from the url's per-host bucket before sending"""
+        from urllib.parse import urlparse
+
+        netloc = urlparse(url).netloc
+        bucket = self._buckets.get(netloc)
+        if bucket is None:
+            with self._buckets_lock:
+                bucket = self._buckets.setdefault(netloc, _TokenBucket())
+        bucket.acquire()
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None,
+            headers: Optional[Dict[str, str]] = None,
+            cache: bool = False) -> "requests.Response":
+        """Make a GET request
+
+        With cache=True, 200 responses are served from a two-tier
+        (memory + shelve) cache for an hour and revalidated with
+        conditional requests afterwards; a stale entry is still returned
+        when revalidation fails with a network error.
+        """
+        if cache:
+            return self._cached_get(url, params, headers)
+        self._pace(url)
+        return self.session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=self.timeout
+        )
+
+    def get_many(self, urls: List[str], max_concurrency: int = 16,
+                 headers: Optional[Dict[str, str]] = None,
+                 cache: bool = False) -> List[Optional["requests.Response"]]:
+        """Fetch many URLs concurrently, preserving input order
+
+        High-fanout scans otherwise pay one round trip after another;
+        this overlaps them on a thread pool sized within the adapter's
+        connection pool so threads reuse keep-alive sockets. A failed
+        fetch yields None in its slot instead of cancelling the rest.
+        """
+        if not urls:
+            return []
+
+        fetch = safe_none(
+            functools.partial(self.get, headers=headers, cache=cache)
+        )
+        workers = min(max_concurrency, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fetch, urls))
+
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]],
+                    headers: Optional[Dict[str, str]]) -> "requests.Response":
+        """Serve a GET through the ETag/Last-Modified-aware cache
+
+        Entries are (stored_at, etag, last_modified, status, headers,
+        body); keys hash the method, url and sorted params.
+        """
+        import requests
+
+        key = hashlib.sha1(
+            repr(("GET", url, sorted((params or {}).items()))).encode()
+        ).hexdigest()
+        now = time.time()
+
+        entry = self._response_cache.get(key)
+        if entry is None:
+            with self._cache_lock:
+                try:
+                    with shelve.open(_HTTP_CACHE_PATH) as db:
+                        entry = db.get(key)
+                except OSError:
+                    entry = None
+            if entry is not None:
+                self._response_cache[key] = entry
+
+        if entry is not None and now - entry[0] < _HTTP_CACHE_TTL:
+            return self._response_from_entry(entry, url)
+
+        # Stale or missing: go to the network, conditionally if we can
+        conditional = dict(headers or {})
+        if entry is not None:
+            if entry[1]:
+                conditional["If-None-Match"] = entry[1]
+            if entry[2]:
+                conditional["If-Modified-Since"] = entry[2]
+
         try:
-            response = self.session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=self.timeout
-            )
-            return response
-        except requests.exceptions.RequestException as e:
-            # Re-raise with more context
-            raise requests.exceptions.RequestException(f"GET request failed for {url}: {e}")
-    
+            response = self.get(url, params=params,
+                                headers=conditional or None)
+        except requests.exceptions.RequestException:
+            if entry is not None:
+                # Stale beats nothing when the endpoint is unreachable
+                return self._response_from_entry(entry, url)
+            raise
+
+        if entry is not None and response.status_code == 304:
+            entry = (now,) + entry[1:]
+            self._store_entry(key, entry)
+            return self._response_from_entry(entry, url)
+
+        if response.status_code == 200:
+            self._store_entry(key, (
+                now,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                response.status_code,
+                dict(response.headers),
+                response.content
+            ))
+
+        return response
+
+    def _store_entry(self, key: str, entry: tuple) -> None:
+        """Write a cache entry to both tiers; disk failures are ignored"""
+        self._response_cache[key] = entry
+        with self._cache_lock:
+            try:
+                os.makedirs(os.path.dirname(_HTTP_CACHE_PATH), exist_ok=True)
+                with shelve.open(_HTTP_CACHE_PATH) as db:
+                    db[key] = entry
+            except OSError:
+                pass
+
+    @staticmethod
+    def _response_from_entry(entry: tuple, url: str) -> "requests.Response":
+        """Rebuild a Response object from a cache entry"""
+        import requests
+
+        response = requests.models.Response()
+        response.status_code = entry[3]
+        response.headers.update(entry[4])
+        response._content = entry[5]
+        response.url = url
+        return response
+
     def post(self, url: str, data: Optional[Dict[str, Any]] = None,
-             json: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+             json: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> "requests.Response":
         """Make a POST request"""
-        try:
-            response = self.session.post(
-                url,
-                data=data,
-                json=json,
-                headers=headers,
-                timeout=self.timeout
-            )
-            return response
-        except requests.exceptions.RequestException as e:
-            # Re-raise with more context
-            raise requests.exceptions.RequestException(f"POST request failed for {url}: {e}")
-    
-    def head(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        self._pace(url)
+        return self.session.post(
+            url,
+            data=data,
+            json=json,
+            headers=headers,
+            timeout=self.timeout
+        )
+
+    def head(self, url: str, headers: Optional[Dict[str, str]] = None,
+             allow_redirects: bool = False) -> "requests.Response":
         """Make a HEAD request"""
+        self._pace(url)
+        return self.session.head(
+            url,
+            headers=headers,
+            timeout=self.timeout,
+            allow_redirects=allow_redirects
+        )
+
+    def exists(self, url: str,
+               headers: Optional[Dict[str, str]] = None) -> bool:
+        """Probe a URL with HEAD and report whether it resolves
+
+        Enumeration callers only need a yes/no, so this collapses the
+        response to `status_code < 400` (redirects count as existing)
+        and treats network failures as absent instead of raising.
+        """
         try:
-            response = self.session.head(
-                url,
-                headers=headers,
-                timeout=self.timeout
-            )
-            return response
-        except requests.exceptions.RequestException as e:
-            # Re-raise with more context
-            raise requests.exceptions.RequestException(f"HEAD request failed for {url}: {e}")
-    
+            return self.head(url, headers=headers).status_code < 400
+        except _safe_none_errors():
+            return False
+
+    def exists_many(self, urls: List[str], max_concurrency: int = 16,
+                    headers: Optional[Dict[str, str]] = None) -> List[bool]:
+        """Probe many URLs concurrently, preserving input order
+
+        Existence probes are latency-bound, so they overlap on the same
+        pool sizing get_many uses.
+        """
+        if not urls:
+            return []
+
+        probe = functools.partial(self.exists, headers=headers)
+        workers = min(max_concurrency, len(urls))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(probe, urls))
+
     def close(self):
         """Close the session"""
-        self.session.close()
-    
+        if self._session is not None:
+            self._session.close()
+
     def __enter__(self):
         """Context manager entry"""
         return self
-    
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        self.close() 
\ No newline at end of file
+        self.close()
@@ -3,19 +3,73 @@ Logging Utility
 Provides centralized logging configuration for the application.
 """
 
+import functools
+import json
 import logging
+import os
 import sys
 from typing import Optional
 
+# Formatters are stateless; build both once at import instead of per setup
+_DEBUG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
+)
+_DEFAULT_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s'
+)
+
+
+class _JsonFormatter(logging.Formatter):
+    """Newline-delimited JSON records for log shippers
+
+    Enabled with AUTO_OSINT_LOG_JSON=1; one json.dumps per record beats
+    shipping pipelines re-parsing the human-readable format.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        return json.dumps({
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "name": record.name,
+            "message": record.getMessage()
+        })
+
+
+class _LazyStreamHandler(logging.StreamHandler):
+    """Console handler that binds to sys.stdout at first emit
+
+    Test-mode and scripted runs that never log above threshold touch no
+    stream at all, and anything that swaps sys.stdout after setup still
+    gets records on the stream active when logging actually happens.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._bound = False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not self._bound:
+            self.setStream(sys.stdout)
+            self._bound = True
+        super().emit(record)
+
+# Cached "is debug logging on" flag so hot paths can gate log calls with
+# a plain attribute check before formatting arguments; setup_logger
+# refreshes it
+LOG_DEBUG = False
+
 
 def setup_logger(debug: bool = False, verbose: bool = False) -> logging.Logger:
     """Setup and configure the application logger"""
+    global LOG_DEBUG
+
     logger = logging.getLogger("auto_osint")
-    
+
     # Avoid adding handlers multiple times
     if logger.handlers:
+        LOG_DEBUG = logger.isEnabledFor(logging.DEBUG)
         return logger
-    
+
     # Set log level
     if debug:
         log_level = logging.DEBUG
@@ -26,32 +80,43 @@ def setup_logger(debug: bool = False, verbose: bool = False) -> logging.Logger:
     
     logger.setLevel(log_level)
     
-    # Create console handler
-    console_handler = logging.StreamHandler(sys.stdout)
+    # Create console handler; the stream is bound lazily on first emit
+    console_handler = _LazyStreamHandler()
     console_handler.setLevel(log_level)
-    
-    # Create formatter
-    if debug:
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-        )
+
+    if os.getenv("AUTO_OSINT_LOG_JSON") == "1":
+        formatter = _JsonFormatter()
     else:
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        )
-    
+        formatter = _DEBUG_FORMATTER if debug else _DEFAULT_FORMATTER
     console_handler.setFormatter(formatter)
     logger.addHandler(console_handler)
-    
+
     # Suppress noisy third-party loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
     logging.getLogger("requests").setLevel(logging.WARNING)
-    
+
+    if not debug:
+        # Only the debug format reads %(funcName)s/%(lineno)d, so skip
+        # findCaller's sys._getframe stack walk — the dominant cost of a
+        # record — along with the process/thread field lookups
+        logging._srcfile = None
+        logging.logProcesses = False
+        logging.logThreads = False
+        logging.logMultiprocessing = False
+
+    LOG_DEBUG = logger.isEnabledFor(logging.DEBUG)
+
     return logger
 
 
+# The app logger itself, resolved once; logging.getLogger takes the
+# manager lock per call, which hot paths calling get_logger shouldn't pay
+_APP_LOGGER = logging.getLogger("auto_osint")
+
+
+@functools.lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
     """Get a logger instance"""
     if name:
         return logging.getLogger(f"auto_osint.{name}")
-    return logging.getLogger("auto_osint") 
\ No newline at end of file
+    return _APP_LOGGER
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Target View Utility
+Provides a normalized, read-only view of a scan target shared across scanners.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+@dataclass(frozen=True, slots=True)
+class TargetView:
+    """Read-only view of a target with derived fields computed once
+
+    Scanners receive one view per scan instead of each re-walking the raw
+    target dict (and re-splitting the email for its domain). The mapping
+    style get/[] accessors keep the view interchangeable with the plain
+    dicts tests and direct callers pass in.
+    """
+    email: Optional[str] = None
+    username: Optional[str] = None
+    full_name: Optional[str] = None
+    phone: Optional[str] = None
+    domain: Optional[str] = None
+    ip: Optional[str] = None
+    image_url: Optional[str] = None
+    email_domain: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, target: Dict[str, str]) -> "TargetView":
+        """Build a view from a raw target dict"""
+        email = target.get("email")
+        email_domain = target.get("email_domain")
+        if email_domain is None and email and "@" in email:
+            email_domain = email.split("@")[1]
+
+        return cls(
+            email=email,
+            username=target.get("username"),
+            full_name=target.get("full_name"),
+            phone=target.get("phone"),
+            domain=target.get("domain"),
+            ip=target.get("ip"),
+            image_url=target.get("image_url"),
+            email_domain=email_domain
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Mapping-style access so scanners can treat views like dicts"""
+        value = getattr(self, key, None)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, key)
+        if value is None:
+            raise KeyError(key)
+        return value